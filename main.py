@@ -7,6 +7,7 @@ from src.experiments.runner import run_experiments
 from src.experiments.analysis import run_analysis
 from src.experiments.samples import generate_samples
 from src.ui.my_game import run_game
+from src.maze.cache import MazeCache
 import csv
 import os
 
@@ -31,6 +32,8 @@ def write_results(filename, results):
     print(f"Wrote {filepath}")
 
 def run_experiment_mode():
+    # blocks share sizes/seeds, so generate each maze once
+    cache = MazeCache()
 
     # -------------------------
     # Size Scaling
@@ -46,6 +49,7 @@ def run_experiment_mode():
         gammas=(0.9,),
         goal_rewards=(100,),
         step_costs=(-1,),
+        cache=cache,
     )
 
     write_results("results_scaling.csv", results_scaling)
@@ -64,6 +68,7 @@ def run_experiment_mode():
         gammas=(0.9,),
         goal_rewards=(100,),
         step_costs=(-1,),
+        cache=cache,
     )
 
     write_results("results_openness.csv", results_openness)
@@ -82,6 +87,7 @@ def run_experiment_mode():
         gammas=(0.7, 0.8, 0.9, 0.95, 0.99),
         goal_rewards=(100,),
         step_costs=(-1,),
+        cache=cache,
     )
 
     write_results("results_gamma.csv", results_gamma)
@@ -44,7 +44,7 @@ def plot_runtime_vs_size(scaling_df, log_scale=True):
 
 def plot_search_work_vs_size(scaling_df):
     search = scaling_df[
-        scaling_df["algorithm"].isin(["DFS", "BFS", "A*_Manhattan", "A*_Euclidean"])
+        scaling_df["algorithm"].isin(["DFS", "BFS", "Bidirectional_BFS", "A*_Manhattan", "A*_Euclidean"])
     ]
 
     df = mean_by(search, ["size", "algorithm"])
@@ -96,7 +96,7 @@ def runtime_summary_table(scaling_df, size=50):
 
 def plot_search_runtime_vs_work(scaling_df):
     search = scaling_df[
-        scaling_df["algorithm"].isin(["DFS", "BFS", "A*_Manhattan", "A*_Euclidean"])
+        scaling_df["algorithm"].isin(["DFS", "BFS", "Bidirectional_BFS", "A*_Manhattan", "A*_Euclidean"])
     ]
 
     for algo in search["algorithm"].unique():
@@ -112,7 +112,7 @@ def plot_search_runtime_vs_work(scaling_df):
 
 def plot_search_memory_vs_size(scaling_df):
     search = scaling_df[
-        scaling_df["algorithm"].isin(["DFS", "BFS", "A*_Manhattan", "A*_Euclidean"])
+        scaling_df["algorithm"].isin(["DFS", "BFS", "Bidirectional_BFS", "A*_Manhattan", "A*_Euclidean"])
     ]
 
     df = mean_by(search, ["size", "algorithm"])
@@ -127,7 +127,7 @@ def plot_search_memory_vs_size(scaling_df):
 def plot_search_runtime_vs_openness(openness_df):
     search = openness_df[
         openness_df["algorithm"].isin(
-            ["DFS", "BFS", "A*_Manhattan", "A*_Euclidean"]
+            ["DFS", "BFS", "Bidirectional_BFS", "A*_Manhattan", "A*_Euclidean"]
         )
     ]
 
@@ -3,13 +3,8 @@ Author: Priyansh Nayak
 Description: Runs experiments across maze sizes / seeds / openness and collects metrics
 """
 
-from src.maze.generator import generate_maze
-from src.solvers.dfs import dfs_solver
-from src.solvers.bfs import bfs_solver
-from src.solvers.astar import astar_solver, manhattan, euclidean
-from src.solvers.value_iter import value_iteration
-from src.solvers.policy_iter import policy_iteration
-from src.solvers.utils import extract_path
+from src.maze.generator import generate_mazes
+from src.solvers.registry import SOLVERS, SEARCH, MDP, get_solver
 
 
 def run_experiments(
@@ -19,132 +14,91 @@ def run_experiments(
     gammas=(0.9,),
     goal_rewards=(100,),
     step_costs=(-1,),
+    cache=None,
+    workers=None,
+    trace="none",
+    solvers=None,
+    warm_start=True,
+    cold_metrics=False,
 ):
-    results = []
-
-    for n in sizes:
-        for openness in openness_levels:
-            for seed in seeds:
-
-                maze = generate_maze(n, n, seed=seed, openness=openness)
-
-                # ---- DFS ----
-                dfs_res = dfs_solver(maze)
-                results.append({
-                    "algorithm": "DFS",
-                    "size": n,
-                    "seed": seed,
-                    "openness": openness,
-                    "gamma": "",
-                    "goal_reward": "",
-                    "step_cost": "",
-                    "moves": dfs_res["moves"],
-                    "runtime": dfs_res["runtime"],
-                    "work": dfs_res["nodes_expanded"],
-                    "memory": dfs_res["memory"],
-                })
+    # only metrics are recorded here, so search traces default to "none"
+    # solvers: registry names to run (default: those registered with experiment=True)
+    # warm_start: on each maze, start every solve of a solver that takes
+    #   init_values / init_policy (the PI variants) after the first from its
+    #   previous gamma / goal_reward / step_cost solution (column "warm_start");
+    #   False keeps every row independent of the sweep order
+    # cold_metrics: also solve each warm-started sweep from scratch and record
+    #   its cold_runtime / cold_work / cold_iterations alongside
+    if solvers is None:
+        chosen = [spec for spec in SOLVERS.values() if spec.experiment]
+    else:
+        chosen = [get_solver(name) for name in solvers]
+    search_solvers = [spec for spec in chosen if spec.kind == SEARCH]
+    mdp_solvers = [spec for spec in chosen if spec.kind == MDP]
 
-                # ---- BFS ----
-                bfs_res = bfs_solver(maze)
-                results.append({
-                    "algorithm": "BFS",
-                    "size": n,
-                    "seed": seed,
-                    "openness": openness,
-                    "gamma": "",
-                    "goal_reward": "",
-                    "step_cost": "",
-                    "moves": bfs_res["moves"],
-                    "runtime": bfs_res["runtime"],
-                    "work": bfs_res["nodes_expanded"],
-                    "memory": bfs_res["memory"],
-                })
+    # generate the whole block up front, in parallel; each maze has its
+    # own seeded RNG stream so results match a serial run exactly
+    specs = [
+        (n, n, seed, openness)
+        for n in sizes
+        for openness in openness_levels
+        for seed in seeds
+    ]
+    # optional MazeCache, so repeated blocks reuse generated mazes
+    if cache is not None:
+        mazes = cache.generate_many(specs, workers=workers)
+    else:
+        mazes = generate_mazes(specs, workers=workers)
 
-                # ---- A* Manhattan ----
-                am_res = astar_solver(maze, heuristic=manhattan)
-                results.append({
-                    "algorithm": "A*_Manhattan",
-                    "size": n,
-                    "seed": seed,
-                    "openness": openness,
-                    "gamma": "",
-                    "goal_reward": "",
-                    "step_cost": "",
-                    "moves": am_res["moves"],
-                    "runtime": am_res["runtime"],
-                    "work": am_res["nodes_expanded"],
-                    "memory": am_res["memory"],
-                })
-
-                # ---- A* Euclidean ----
-                ae_res = astar_solver(maze, heuristic=euclidean)
-                results.append({
-                    "algorithm": "A*_Euclidean",
-                    "size": n,
-                    "seed": seed,
-                    "openness": openness,
-                    "gamma": "",
-                    "goal_reward": "",
-                    "step_cost": "",
-                    "moves": ae_res["moves"],
-                    "runtime": ae_res["runtime"],
-                    "work": ae_res["nodes_expanded"],
-                    "memory": ae_res["memory"],
-                })
-
-                # ---- MDP sweeps ----
-                for gamma in gammas:
-                    for goal_reward in goal_rewards:
-                        for step_cost in step_costs:
+    results = []
 
-                            # Value Iteration
-                            vi_res = value_iteration(
-                                maze,
-                                gamma=gamma,
-                                goal_reward=goal_reward,
-                                step_cost=step_cost,
-                            )
-                            vi_path = extract_path(vi_res["policy"], maze.start, maze.goal)
+    def record(spec, res, n, seed, openness, gamma="", goal_reward="", step_cost="", extra=None):
+        row = {
+            "algorithm": spec.name,
+            "size": n,
+            "seed": seed,
+            "openness": openness,
+            "gamma": gamma,
+            "goal_reward": goal_reward,
+            "step_cost": step_cost,
+            "moves": res.moves,
+            "runtime": res.runtime,
+            "work": res.work,
+            "memory": res.memory,
+        }
+        # solver-specific metrics, e.g. VI iterations / delta
+        for column in spec.columns:
+            row[column] = res.metric(column)
+        if extra:
+            row.update(extra)
+        results.append(row)
 
-                            results.append({
-                                "algorithm": "Value_Iteration",
-                                "size": n,
-                                "seed": seed,
-                                "openness": openness,
-                                "gamma": gamma,
-                                "goal_reward": goal_reward,
-                                "step_cost": step_cost,
-                                "moves": max(0, len(vi_path) - 1),
-                                "runtime": vi_res["runtime"],
-                                "work": vi_res["state_updates"],
-                                "memory": vi_res["memory"],
-                                "iterations": vi_res["iterations"],
-                                "delta": vi_res["delta"],
-                            })
+    for (n, _, seed, openness), maze in zip(specs, mazes):
+        # ---- Search ----
+        for spec in search_solvers:
+            res = spec.run(maze, **spec.select({"trace": trace}))
+            record(spec, res, n, seed, openness)
 
-                            # Policy Iteration
-                            pi_res = policy_iteration(
-                                maze,
-                                gamma=gamma,
-                                goal_reward=goal_reward,
-                                step_cost=step_cost,
-                            )
-                            pi_path = extract_path(pi_res["policy"], maze.start, maze.goal)
+        # ---- MDP sweeps ----
+        previous = {} # solver name -> its last result on this maze
+        for gamma in gammas:
+            for goal_reward in goal_rewards:
+                for step_cost in step_costs:
+                    params = {"gamma": gamma, "goal_reward": goal_reward, "step_cost": step_cost}
+                    for spec in mdp_solvers:
+                        # solvers without init_values / init_policy always start cold
+                        warm = {}
+                        prev = previous.get(spec.name)
+                        if warm_start and prev is not None:
+                            warm = spec.select({"init_values": prev.values, "init_policy": prev.policy})
 
-                            results.append({
-                                "algorithm": "Policy_Iteration",
-                                "size": n,
-                                "seed": seed,
-                                "openness": openness,
-                                "gamma": gamma,
-                                "goal_reward": goal_reward,
-                                "step_cost": step_cost,
-                                "moves": max(0, len(pi_path) - 1),
-                                "runtime": pi_res["runtime"],
-                                "work": pi_res["state_updates"],
-                                "memory": pi_res["memory"],
-                                "policy_iterations": pi_res["policy_iterations"],
-                                "evaluation_iterations": pi_res["evaluation_iterations"],
-                            })
+                        res = spec.run(maze, **params, **warm)
+                        extra = {"warm_start": bool(warm)}
+                        if cold_metrics:
+                            cold = spec.run(maze, **params) if warm else res
+                            extra.update(cold_runtime=cold.runtime, cold_work=cold.work,
+                                         cold_iterations=cold.iterations)
+                        previous[spec.name] = res
+                        record(spec, res, n, seed, openness, gamma, goal_reward, step_cost, extra)
 
-    return results
\ No newline at end of file
+    return results
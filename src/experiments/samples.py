@@ -4,12 +4,8 @@ Description: Sample runs of the maze generation
 """
 from src.maze.generator import generate_maze
 from src.maze.render import render_matplotlib
-from src.solvers.dfs import dfs_solver
-from src.solvers.bfs import bfs_solver
-from src.solvers.astar import astar_solver, manhattan, euclidean
-from src.solvers.value_iter import value_iteration
-from src.solvers.policy_iter import policy_iteration
-from src.solvers.utils import extract_path
+from src.solvers.registry import SOLVERS, MDP
+from src.solvers.astar import astar_solver, manhattan
 import os
 
 def generate_samples():
@@ -26,41 +22,16 @@ def generate_samples():
     # 2. Same Maze – All Solvers
     # --------------------------------------------------
 
-    # DFS
-    res = dfs_solver(maze)
-    path, explored = res["path"], res["explored"]
-    render_matplotlib(maze, path=path, explored=explored,
-                    title="DFS Solution (30x30)")
-
-    # BFS
-    res = bfs_solver(maze)
-    path, explored = res["path"], res["explored"]
-    render_matplotlib(maze, path=path, explored=explored,
-                    title="BFS Solution (30x30)")
-
-    # A* Manhattan
-    res = astar_solver(maze, manhattan)
-    path, explored = res["path"], res["explored"]
-    render_matplotlib(maze, path=path, explored=explored,
-                    title="Astar Manhattan (30x30)")
-
-    # A* Euclidean
-    res = astar_solver(maze, euclidean)
-    path, explored = res["path"], res["explored"]
-    render_matplotlib(maze, path=path, explored=explored,
-                    title="Astar Euclidean (30x30)")
-
-    # Value Iteration
-    res = value_iteration(maze, gamma=0.99)
-    policy = res["policy"]
-    path = extract_path(policy, maze.start, maze.goal)
-    render_matplotlib(maze, path=path, policy=policy, title="Value Iteration Policy (30x30)")
-
-    # Policy Iteration
-    res = policy_iteration(maze, gamma=0.99)
-    policy = res["policy"]
-    path = extract_path(policy, maze.start, maze.goal)
-    render_matplotlib(maze, path=path, policy=policy, title="Policy Iteration Policy (30x30)")
+    # every registered solver with a sample title
+    for spec in SOLVERS.values():
+        if spec.title is None:
+            continue
+        res = spec.run(maze, **spec.select({"gamma": 0.99}))
+        title = f"{spec.title} (30x30)"
+        if spec.kind == MDP:
+            render_matplotlib(maze, path=res.path, policy=res.policy, title=title)
+        else:
+            render_matplotlib(maze, path=res.path, explored=res.explored, title=title)
 
 
     # --------------------------------------------------
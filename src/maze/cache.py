@@ -0,0 +1,135 @@
+"""
+Author: Priyansh Nayak
+Description: Content-addressed on-disk cache for generated mazes
+    with size-bounded LRU eviction
+"""
+import hashlib
+import os
+from src.maze.generator import generate_maze, generate_mazes, GENERATOR_VERSION
+from src.maze.maze import Maze
+from src.maze.storage import save_maze, load_maze
+
+DEFAULT_CACHE_DIR = os.path.join("cache", "mazes")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+class MazeCache:
+    """
+    Caches generate_maze results on disk, one binary maze file per
+    (generator version, height, width, seed, openness) key.
+    Least recently used files are evicted once the cache grows past
+    `max_bytes`. Unseeded requests are not reproducible and bypass it.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, height: int, width: int, seed: int, openness: float) -> str:
+        raw = f"v{GENERATOR_VERSION}:{height}x{width}:seed={seed}:open={float(openness)!r}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".maze")
+
+    def generate(self, height: int, width: int, seed: int | None = None, openness: float = 0.0) -> Maze:
+        """
+        Drop-in replacement for generate_maze that reads through the cache.
+        """
+        if seed is None:
+            return generate_maze(height, width, seed=seed, openness=openness)
+
+        path = self.path_for(self.key(height, width, seed, openness))
+        try:
+            maze = load_maze(path)
+        except (OSError, ValueError):
+            maze = None
+
+        if maze is not None:
+            self.hits += 1
+            os.utime(path)  # mark as recently used
+            return maze
+
+        self.misses += 1
+        maze = generate_maze(height, width, seed=seed, openness=openness)
+        self._store(path, maze)
+        self.evict()
+        return maze
+
+    def generate_many(self, specs, workers: int | None = None):
+        """
+        Batch version of generate(): hits are loaded from disk and all
+        misses are generated together through generate_mazes.
+        """
+        mazes = [None] * len(specs)
+        missing = []
+        for i, (height, width, seed, openness) in enumerate(specs):
+            if seed is None:
+                missing.append(i)
+                continue
+            path = self.path_for(self.key(height, width, seed, openness))
+            try:
+                mazes[i] = load_maze(path)
+            except (OSError, ValueError):
+                missing.append(i)
+                continue
+            self.hits += 1
+            os.utime(path)
+
+        if missing:
+            generated = generate_mazes([specs[i] for i in missing], workers=workers)
+            for i, maze in zip(missing, generated):
+                mazes[i] = maze
+                if maze.seed is not None:
+                    self.misses += 1
+                    self._store(self.path_for(self.key(maze.height, maze.width, maze.seed, maze.openness)), maze)
+            self.evict()
+
+        return mazes
+
+    def _store(self, path: str, maze: Maze) -> None:
+        # write atomically so concurrent readers never see a partial file
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            save_maze(maze, tmp)
+            os.replace(tmp, path)
+        except OSError:
+            # e.g. on Windows the old file may still be memory-mapped by
+            # load_maze; caching is best-effort, so skip this entry
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    def evict(self) -> None:
+        """
+        Remove least recently used mazes until the cache fits in max_bytes.
+        """
+        entries = []
+        total = 0
+        for entry in os.scandir(self.cache_dir):
+            if not entry.name.endswith(".maze"):
+                continue
+            st = entry.stat()
+            entries.append((st.st_mtime, st.st_size, entry.path))
+            total += st.st_size
+
+        entries.sort()  # oldest first
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                continue  # still in use (e.g. mapped by load_maze on Windows): keep it
+            total -= size
+
+    def clear(self) -> None:
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".maze"):
+                os.remove(entry.path)
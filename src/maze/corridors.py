@@ -0,0 +1,86 @@
+"""
+Author: Priyansh Nayak
+Description: Corridor-contracted weighted graph view of a Maze.
+    Chains of degree-2 cells collapse into single weighted edges
+    between junctions, dead ends, start and goal.
+"""
+from typing import List, Tuple
+
+
+class CorridorGraph:
+    """
+    Weighted graph over the "key" cells of a maze (degree != 2, plus
+    start and goal). Nodes are indexed 0..len(nodes)-1 and nodes[i] is
+    the flat cell id of node i.
+
+    Edges are stored CSR-style: the outgoing edges of node i are
+    e in range(offsets[i], offsets[i + 1]), going to node targets[e]
+    with cost weights[e] (number of moves). chains[e] holds the flat ids
+    of the corridor cells walked between the two ends, in order.
+    """
+
+    def __init__(self, maze):
+        self.maze = maze
+        n = maze.height * maze.width
+        cell_offsets, cell_targets = maze.adjacency_lists()
+        self.start = maze.cell_id(maze.start)
+        self.goal = maze.cell_id(maze.goal)
+
+        # key cells become nodes, everything else is corridor
+        node_of = [-1] * n
+        nodes: List[int] = []
+        for cid in range(n):
+            if cell_offsets[cid + 1] - cell_offsets[cid] != 2 or cid == self.start or cid == self.goal:
+                node_of[cid] = len(nodes)
+                nodes.append(cid)
+
+        offsets = [0]
+        targets: List[int] = []
+        weights: List[int] = []
+        chains: List[Tuple[int, ...]] = []
+
+        # walk every corridor leaving every node until the next node
+        for u in nodes:
+            for k in range(cell_offsets[u], cell_offsets[u + 1]):
+                prev, cur = u, cell_targets[k]
+                chain = []
+                while node_of[cur] < 0:
+                    chain.append(cur)
+                    lo = cell_offsets[cur]
+                    nxt = cell_targets[lo]
+                    if nxt == prev:
+                        nxt = cell_targets[lo + 1]
+                    prev, cur = cur, nxt
+                targets.append(node_of[cur])
+                weights.append(len(chain) + 1)
+                chains.append(tuple(chain))
+            offsets.append(len(targets))
+
+        self.nodes = nodes
+        self.node_of = node_of
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.chains = chains
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def expand_edges(self, start_node: int, edges: List[int]) -> List[int]:
+        """
+        Expand a node walk (start node + edges taken) into the full list
+        of flat cell ids, corridor cells included.
+        """
+        cells = [self.nodes[start_node]]
+        for e in edges:
+            cells.extend(self.chains[e])
+            cells.append(self.nodes[self.targets[e]])
+        return cells
+
+    def expand_path(self, edges: List[int]) -> List[Tuple[int, int]]:
+        """
+        Expand the edges of a start-to-goal walk into (row, col) cells,
+        ready for render_matplotlib or the UI.
+        """
+        start_node = self.node_of[self.start]
+        return [self.maze.cell_at(cid) for cid in self.expand_edges(start_node, edges)]
@@ -1,66 +1,264 @@
 """
 Author: Priyansh Nayak
 Description: Generators a solvable maze
-    using Recursive Backtracking
+    using Recursive Backtracking, or row by row
+    with Eller's algorithm for very tall mazes
 """
+import os
 import random
-from src.maze.maze import Maze, DIRS, DELTAS
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Sequence, Tuple
+import numpy as np
+from src.maze.maze import Maze, DIRS, OPPOSITE, WALL_BITS, ALL_WALLS
+from src.maze.storage import save_rows
 
+# bump whenever generation output changes for a given seed,
+# so cached mazes from an older algorithm are never reused
+GENERATOR_VERSION = 2
 
-def generate_maze(height: int, width: int, seed: int | None = None, openness: float = 0.0) -> Maze:
-    # seed for reproducibility 
-    if seed is not None:
-        random.seed(seed)
 
-    maze = Maze(height, width)
+# per direction, in DIRS order: (wall bit, opposite wall bit)
+_CARVE_BITS = tuple((WALL_BITS[d], WALL_BITS[OPPOSITE[d]]) for d in DIRS)
+
+
+def _carve_backtracker(height: int, width: int, rng: random.Random) -> bytearray:
+    """
+    Recursive backtracking over flat cell ids, from (0, 0).
+    Returns the carved wall grid as a row-major bytearray.
+
+    State is a bytearray visited mask and an array('i') stack, so a
+    5000x5000 maze needs tens of MB rather than gigabytes of tuples.
+    Candidates are gathered in DIRS order and picked with
+    rng.randrange, which draws exactly like random.choice did, so a
+    given seed carves the same maze as the tuple-based version.
+    """
+    if height <= 0 or width <= 0:
+        raise ValueError("Maze height and width must be positive integers.")
 
-    visited = set()
-    stack = [(0, 0)]
-    visited.add((0, 0))
+    n = height * width
+    walls = bytearray([ALL_WALLS]) * n
+    visited = bytearray(n)
+    stack = array("i", [0])
+    visited[0] = 1
+
+    steps = (-width, 1, width, -1)  # id offsets in DIRS order
+    candidates = [0, 0, 0, 0]
 
     # explore maze with RBT
     while stack:
-        r, c = stack[-1] # current cell
-
-        # collect unvisited neighbours with direction info
-        options = []
-        for d in DIRS:
-            dr, dc = DELTAS[d]
-            nr, nc = r + dr, c + dc
-            # valid neighbour and unvisited
-            if 0 <= nr < height and 0 <= nc < width and (nr, nc) not in visited:
-                options.append((d, (nr, nc)))
+        cur = stack[-1] # current cell
+        r, c = divmod(cur, width)
+
+        # collect unvisited neighbours (direction indices, DIRS order)
+        k = 0
+        if r > 0 and not visited[cur - width]:
+            candidates[k] = 0
+            k += 1
+        if c < width - 1 and not visited[cur + 1]:
+            candidates[k] = 1
+            k += 1
+        if r < height - 1 and not visited[cur + width]:
+            candidates[k] = 2
+            k += 1
+        if c > 0 and not visited[cur - 1]:
+            candidates[k] = 3
+            k += 1
+
         # carve a passage
-        if options:
-            direction, nxt = random.choice(options)
-            # remove the wall between current cell and chosen neighbour
-            maze.remove_wall((r, c), direction)
-            # mark neighbour visited and continue
-            visited.add(nxt)
+        if k:
+            d = candidates[rng.randrange(k)]
+            nxt = cur + steps[d]
+            bit, opposite = _CARVE_BITS[d]
+            walls[cur] &= ~bit
+            walls[nxt] &= ~opposite
+            visited[nxt] = 1
             stack.append(nxt)
         else:
             stack.pop() # dead end
 
+    return walls
+
+
+def generate_maze(height: int, width: int, seed: int | None = None, openness: float = 0.0) -> Maze:
+    # private RNG stream for reproducibility; random.Random(seed) yields the
+    # same sequence random.seed(seed) did, without touching global state
+    rng = random.Random(seed)
+
+    walls = _carve_backtracker(height, width, rng)
+    maze = Maze(
+        height, width,
+        walls=np.frombuffer(walls, dtype=np.uint8).reshape(height, width),
+        seed=seed, openness=openness,
+    )
+
     # add extra random connections to introduce loops
     if openness > 0:
-        possible_walls = []
-        # collect all removable interior walls
-        for r in range(height):
+        open_walls(maze, openness, np.random.default_rng(rng.getrandbits(64)))
+
+    return maze
+
+
+def open_walls(maze: Maze, openness: float, rng: np.random.Generator) -> None:
+    """
+    Remove a random `openness` fraction of the interior walls still standing.
+    Each wall is enumerated once (as the E or S side of a cell), sampled
+    without replacement, and removed in bulk on the wall grid.
+    """
+    grid = maze.wall_grid()
+    width = maze.width
+
+    # flat ids of cells whose east / south wall is interior and still up
+    rows, cols = np.nonzero(grid[:, :-1] & WALL_BITS["E"])
+    east = rows * width + cols
+    rows, cols = np.nonzero(grid[:-1, :] & WALL_BITS["S"])
+    south = rows * width + cols
+
+    total = len(east) + len(south)
+    k = int(total * openness)
+    if k == 0:
+        return
+
+    picks = rng.choice(total, size=k, replace=False)
+    maze.remove_walls(east[picks[picks < len(east)]], "E")
+    maze.remove_walls(south[picks[picks >= len(east)] - len(east)], "S")
+
+
+# (height, width, seed, openness)
+MazeSpec = Tuple[int, int, int | None, float]
+
+
+def derive_seed(base_seed: int, index: int) -> int:
+    """
+    Independent, reproducible seed for the index-th maze of a batch.
+    """
+    return int(np.random.SeedSequence(base_seed, spawn_key=(index,)).generate_state(1)[0])
+
+
+def _generate_spec(spec: MazeSpec) -> Maze:
+    height, width, seed, openness = spec
+    return generate_maze(height, width, seed=seed, openness=openness)
+
+
+def generate_mazes(specs: Sequence[MazeSpec], workers: int | None = None,
+                   base_seed: int | None = None) -> List[Maze]:
+    """
+    Generate a batch of mazes, optionally over a process pool.
+
+    Every maze draws from its own RNG stream seeded by its spec, so the
+    output is identical to a serial run whatever the worker count.
+    Unseeded specs get a seed derived from `base_seed` and their index
+    when one is given.
+
+    workers: pool size (None = one per CPU, 1 = run serially in-process)
+    """
+    specs = [
+        (h, w, derive_seed(base_seed, i) if seed is None and base_seed is not None else seed, op)
+        for i, (h, w, seed, op) in enumerate(specs)
+    ]
+
+    if workers == 1 or len(specs) <= 1:
+        return [_generate_spec(spec) for spec in specs]
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(specs) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_generate_spec, specs, chunksize=chunksize))
+
+
+def eller_rows(height: int, width: int, seed: int | None = None, openness: float = 0.0) -> Iterator[np.ndarray]:
+    """
+    Generate a maze one row at a time with Eller's algorithm.
+
+    Yields `height` uint8 arrays of length `width`, each one row of the
+    wall grid (bits as in WALL_BITS). Only O(width) state is kept, so
+    the height is unbounded. Uses its own RNG stream, so the global
+    `random` state is left alone.
+
+    openness: each interior wall still standing after carving is opened
+    with this probability, adding loops as generate_maze does.
+    """
+    if height <= 0 or width <= 0:
+        raise ValueError("Maze height and width must be positive integers.")
+
+    rng = random.Random(seed)
+    north, east, south, west = (WALL_BITS[d] for d in DIRS)
+
+    # set label per column; row 0 starts with every cell in its own set
+    labels = list(range(width))
+    open_above = [False] * width
+
+    for r in range(height):
+        last = r == height - 1
+        row = [ALL_WALLS] * width
+        for c in range(width):
+            if open_above[c]:
+                row[c] &= ~north
+
+        # union-find over this row's columns, seeded from carried labels
+        first = {}
+        parent = [first.setdefault(label, c) for c, label in enumerate(labels)]
+
+        def find(c):
+            while parent[c] != c:
+                parent[c] = parent[parent[c]]
+                c = parent[c]
+            return c
+
+        # join neighbouring sets at random (all of them on the last row)
+        for c in range(width - 1):
+            a, b = find(c), find(c + 1)
+            if a != b and (last or rng.random() < 0.5):
+                parent[b] = a
+            elif not (openness > 0 and rng.random() < openness):
+                continue
+            row[c] &= ~east
+            row[c + 1] &= ~west
+
+        if not last:
+            # every set must carry on downward through at least one cell
+            groups = {}
+            for c in range(width):
+                groups.setdefault(find(c), []).append(c)
+
+            open_above = [False] * width
+            for root, cols in groups.items():
+                down = [c for c in cols if rng.random() < 0.5]
+                if not down:
+                    down = [rng.choice(cols)]
+                for c in down:
+                    open_above[c] = True
+                    labels[c] = root
+
+            # cells left closed start a fresh set in the next row
             for c in range(width):
-                for d in DIRS:
-                    dr, dc = DELTAS[d]
-                    nr, nc = r + dr, c + dc
-                    # ensure neighbour exists
-                    if 0 <= nr < height and 0 <= nc < width:
-                        # only consider valid walls
-                        if maze.has_wall((r, c), d):
-                            possible_walls.append(((r, c), d))
-        # random distribution of open walls 
-        random.shuffle(possible_walls)
-        loops_to_add = int(len(possible_walls) * openness)
-        # add the alternate paths
-        for (cell, d) in possible_walls[:loops_to_add]:
-            if maze.has_wall(cell, d):
-                maze.remove_wall(cell, d)
-
-    return maze
\ No newline at end of file
+                if not open_above[c]:
+                    labels[c] = width + c
+                    if openness > 0 and rng.random() < openness:
+                        open_above[c] = True
+                if open_above[c]:
+                    row[c] &= ~south
+
+        yield np.array(row, dtype=np.uint8)
+
+
+def generate_maze_eller(height: int, width: int, seed: int | None = None, openness: float = 0.0) -> Maze:
+    """
+    Build an in-memory Maze from eller_rows.
+    """
+    walls = np.empty((height, width), dtype=np.uint8)
+    for r, row in enumerate(eller_rows(height, width, seed=seed, openness=openness)):
+        walls[r] = row
+    return Maze(height, width, walls=walls, seed=seed, openness=openness)
+
+
+def stream_maze_eller(path, height: int, width: int, seed: int | None = None, openness: float = 0.0) -> None:
+    """
+    Generate a maze with Eller's algorithm straight into a binary maze
+    file, never holding more than one row in memory.
+    """
+    save_rows(
+        path, height, width,
+        eller_rows(height, width, seed=seed, openness=openness),
+        seed=seed, openness=openness,
+    )
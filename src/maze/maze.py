@@ -2,8 +2,9 @@
 Author: Priyansh Nayak
 Description: Stores the structure of a maze
 """
-from typing import Dict, List, Tuple, Iterable
-from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Iterable
+from dataclasses import dataclass, field
+import numpy as np
 
 # Rules
 Cell = Tuple[int, int] # (row, col)
@@ -20,13 +21,30 @@ DELTAS: Dict[str, Tuple[int, int]] = {
 
 OPPOSITE = {N: S, E: W, S: N, W: E}
 
+# One bit per direction in the packed wall grid (set bit => wall present)
+WALL_BITS: Dict[str, int] = {
+    N: 1,
+    E: 2,
+    S: 4,
+    W: 8,
+}
+ALL_WALLS = 15
+
 @dataclass
 class Maze:
     height: int
     width: int
     start: Cell = (0, 0)
     goal: Cell = None # type: ignore
-    walls: List[List[Dict[str, bool]]] = None  # type: ignore
+    walls: np.ndarray = field(default=None, repr=False, compare=False)  # type: ignore
+    # generation parameters, kept for the on-disk header
+    seed: Optional[int] = None
+    openness: float = 0.0
+    # cached CSR adjacency (offsets, targets), rebuilt lazily after wall edits
+    _csr: Optional[Tuple[np.ndarray, np.ndarray]] = field(default=None, init=False, repr=False, compare=False)
+    _csr_lists: Optional[Tuple[List[int], List[int]]] = field(default=None, init=False, repr=False, compare=False)
+    # other structures derived from the walls (see derived()), same lifetime as the CSR
+    _derived: Dict[Hashable, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.height <= 0 or self.width <= 0:
@@ -36,10 +54,13 @@ class Maze:
             self.goal = (self.height - 1, self.width - 1)
 
         # Initialize every cell with all walls present
-        self.walls = [
-            [{d: True for d in DIRS} for _ in range(self.width)]
-            for _ in range(self.height)
-        ]
+        if self.walls is None:
+            self.walls = np.full((self.height, self.width), ALL_WALLS, dtype=np.uint8)
+        elif self.walls.shape != (self.height, self.width):
+            raise ValueError(
+                f"Wall grid shape {self.walls.shape} does not match maze "
+                f"({self.height}, {self.width})."
+            )
 
         # Sanity-check start/goal
         if not self.in_bounds(self.start):
@@ -53,7 +74,7 @@ class Maze:
 
     def has_wall(self, cell: Cell, direction: str) -> bool:
         r, c = cell
-        return self.walls[r][c][direction]
+        return bool(self.walls[r, c] & WALL_BITS[direction])
     
     def remove_wall(self, cell: Cell, direction: str) -> None:
         """
@@ -72,18 +93,59 @@ class Maze:
             raise ValueError(f"Cannot remove wall {direction} from {cell}: neighbor out of bounds.")
 
         # Remove wall in current cell
-        self.walls[r][c][direction] = False
+        self.walls[r, c] &= ~WALL_BITS[direction] & ALL_WALLS
         # Remove opposite wall in neighbor cell
-        self.walls[nr][nc][OPPOSITE[direction]] = False
+        self.walls[nr, nc] &= ~WALL_BITS[OPPOSITE[direction]] & ALL_WALLS
+        self._invalidate()
+
+    def add_wall(self, cell: Cell, direction: str) -> None:
+        """
+        Put back the wall on `cell` in `direction`,
+        and the opposite wall on the neighboring cell.
+        """
+        if direction not in DIRS:
+            raise ValueError(f"Invalid direction: {direction}")
+
+        r, c = cell
+        dr, dc = DELTAS[direction]
+        nr, nc = r + dr, c + dc
+        neighbor = (nr, nc)
+
+        if not self.in_bounds(neighbor):
+            raise ValueError(f"Cannot add wall {direction} to {cell}: neighbor out of bounds.")
+
+        self.walls[r, c] |= WALL_BITS[direction]
+        self.walls[nr, nc] |= WALL_BITS[OPPOSITE[direction]]
+        self._invalidate()
+
+    def remove_walls(self, ids: np.ndarray, direction: str) -> None:
+        """
+        Vectorized remove_wall for many cells at once,
+        given as flat cell ids, all in the same `direction`.
+        """
+        if direction not in DIRS:
+            raise ValueError(f"Invalid direction: {direction}")
+
+        rows, cols = np.divmod(np.asarray(ids, dtype=np.int64), self.width)
+        dr, dc = DELTAS[direction]
+        nr, nc = rows + dr, cols + dc
+
+        if not ((nr >= 0) & (nr < self.height) & (nc >= 0) & (nc < self.width)).all():
+            raise ValueError(f"Cannot remove walls {direction}: some neighbors out of bounds.")
+
+        self.walls[rows, cols] &= ~WALL_BITS[direction] & ALL_WALLS
+        self.walls[nr, nc] &= ~WALL_BITS[OPPOSITE[direction]] & ALL_WALLS
+        self._invalidate()
 
     def neighbors(self, cell: Cell) -> List[Cell]:
         """
         Return reachable neighbors from this cell (no wall blocking).
         """
         r, c = cell
+        bits = int(self.walls[r, c])
         result: List[Cell] = []
         for d in DIRS:
-            if not self.walls[r][c][d]:  # no wall => passage
+            if not bits & WALL_BITS[d]:  # no wall => passage
                 dr, dc = DELTAS[d]
                 nxt = (r + dr, c + dc)
                 if self.in_bounds(nxt):
@@ -93,4 +155,87 @@ class Maze:
     def all_cells(self) -> Iterable[Cell]:
         for r in range(self.height):
             for c in range(self.width):
-                yield (r, c)
\ No newline at end of file
+                yield (r, c)
+
+    def wall_grid(self) -> np.ndarray:
+        """
+        Return the raw (height, width) uint8 wall grid, one bit per
+        direction as in WALL_BITS. Shared with the maze, not copied.
+        """
+        return self.walls
+
+    def cell_id(self, cell: Cell) -> int:
+        """Flat id of a cell (r * width + c)."""
+        r, c = cell
+        return r * self.width + c
+
+    def cell_at(self, cid: int) -> Cell:
+        """Inverse of cell_id."""
+        return divmod(cid, self.width)
+
+    def adjacency(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compressed-sparse-row adjacency over flat cell ids.
+        Neighbours of id i are targets[offsets[i]:offsets[i + 1]],
+        in the same N, E, S, W order as neighbors().
+        """
+        if self._csr is None:
+            self._csr = self._build_csr()
+        return self._csr
+
+    def adjacency_lists(self) -> Tuple[List[int], List[int]]:
+        """
+        adjacency() as plain Python lists, for solvers that walk it
+        in pure-Python loops without touching NumPy scalars.
+        """
+        if self._csr_lists is None:
+            offsets, targets = self.adjacency()
+            self._csr_lists = (offsets.tolist(), targets.tolist())
+        return self._csr_lists
+
+    def neighbor_ids(self, cid: int) -> List[int]:
+        """
+        Reachable neighbour ids of flat id `cid`.
+        Hot loops should index adjacency_lists() directly instead.
+        """
+        offsets, targets = self.adjacency_lists()
+        return targets[offsets[cid]:offsets[cid + 1]]
+
+    def _build_csr(self) -> Tuple[np.ndarray, np.ndarray]:
+        h, w = self.height, self.width
+        ids = np.arange(h * w, dtype=np.int32).reshape(h, w)
+        rows, cols = np.indices((h, w))
+
+        # (n, 4) table of neighbour ids in DIRS order, -1 where blocked
+        table = np.full((h, w, len(DIRS)), -1, dtype=np.int32)
+        for k, d in enumerate(DIRS):
+            dr, dc = DELTAS[d]
+            nr, nc = rows + dr, cols + dc
+            ok = ((self.walls & WALL_BITS[d]) == 0) & (nr >= 0) & (nr < h) & (nc >= 0) & (nc < w)
+            table[..., k][ok] = ids[nr[ok], nc[ok]]
+        table = table.reshape(h * w, len(DIRS))
+
+        open_mask = table >= 0
+        offsets = np.zeros(h * w + 1, dtype=np.int32)
+        np.cumsum(open_mask.sum(axis=1), out=offsets[1:])
+        targets = table[open_mask]  # row-major, so per-cell DIRS order is kept
+        return offsets, targets
+
+    def derived(self, key: Hashable, build: Callable[["Maze"], Any]) -> Any:
+        """
+        Return data derived from the wall layout under `key`, calling
+        build(self) on first use. Dropped whenever a wall is added or removed.
+        """
+        try:
+            return self._derived[key]
+        except KeyError:
+            value = self._derived[key] = build(self)
+            return value
+
+    def has_derived(self, key: Hashable) -> bool:
+        return key in self._derived
+
+    def _invalidate(self) -> None:
+        self._csr = None
+        self._csr_lists = None
+        self._derived.clear()
@@ -7,8 +7,19 @@ from matplotlib.patches import Rectangle, Patch
 from matplotlib.lines import Line2D
 from matplotlib.collections import LineCollection, PatchCollection
 from matplotlib.colors import ListedColormap
+import numpy as np
 import os
 
+from src.maze.maze import WALL_BITS
+
+# wall segment endpoints relative to the cell's top-left corner (x1, y1, x2, y2)
+WALL_SEGMENTS = {
+    "N": (0, 0, 1, 0),
+    "S": (0, 1, 1, 1),
+    "W": (0, 0, 0, 1),
+    "E": (1, 0, 1, 1),
+}
+
 def render_ascii(maze, path=None) -> None:
     """
     Render the maze in ASCII form.
@@ -108,20 +119,16 @@ def render_matplotlib(maze, path=None, explored=None, policy=None, title="Maze")
             interpolation="nearest",
         )
 
-    # draw walls
+    # draw walls straight from the packed grid
+    grid = maze.wall_grid()
     segments = []  # each segment is [(x1,y1), (x2,y2)]
-    for r in range(h):
-        for c in range(w):
-            cell = (r, c)
-            # check all directions
-            if maze.has_wall(cell, "N"):
-                segments.append([(c, r), (c + 1, r)])
-            if maze.has_wall(cell, "S"):
-                segments.append([(c, r + 1), (c + 1, r + 1)])
-            if maze.has_wall(cell, "W"):
-                segments.append([(c, r), (c, r + 1)])
-            if maze.has_wall(cell, "E"):
-                segments.append([(c + 1, r), (c + 1, r + 1)])
+    for d, (x1, y1, x2, y2) in WALL_SEGMENTS.items():
+        rows, cols = np.nonzero(grid & WALL_BITS[d])
+        segs = np.stack([
+            np.stack([cols + x1, rows + y1], axis=1),
+            np.stack([cols + x2, rows + y2], axis=1),
+        ], axis=1)
+        segments.extend(segs.tolist())
 
     wall_lines = LineCollection(segments, colors="black", linewidths=1.5)
     ax.add_collection(wall_lines)
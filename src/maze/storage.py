@@ -0,0 +1,126 @@
+"""
+Author: Priyansh Nayak
+Description: Compact binary file format for Maze,
+    with memory-mapped loading of the wall grid
+"""
+import struct
+import numpy as np
+from src.maze.maze import Maze
+
+# File layout (little-endian):
+#   64-byte header  magic, version, flags, dims, start, goal, seed, openness
+#   wall section    height * width uint8, row-major, bits as in WALL_BITS
+# The wall section is the in-memory grid verbatim, so it can be mapped
+# straight into Maze.walls without any parsing.
+MAGIC = b"MAZE"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIIIIIqd")
+HEADER_SIZE = 64
+
+FLAG_HAS_SEED = 1
+
+
+def _pack_header(height, width, start, goal, seed, openness) -> bytes:
+    flags = FLAG_HAS_SEED if seed is not None else 0
+    header = HEADER.pack(
+        MAGIC, VERSION, flags,
+        height, width,
+        start[0], start[1],
+        goal[0], goal[1],
+        seed if seed is not None else 0,
+        openness,
+    )
+    return header.ljust(HEADER_SIZE, b"\0")
+
+
+def read_header(path) -> dict:
+    """
+    Read only the header of a maze file.
+    """
+    with open(path, "rb") as f:
+        raw = f.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE:
+        raise ValueError(f"{path}: truncated maze header.")
+
+    magic, version, flags, h, w, sr, sc, gr, gc, seed, openness = HEADER.unpack_from(raw)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a maze file.")
+    if version != VERSION:
+        raise ValueError(f"{path}: unsupported maze file version {version}.")
+
+    return {
+        "height": h,
+        "width": w,
+        "start": (sr, sc),
+        "goal": (gr, gc),
+        "seed": seed if flags & FLAG_HAS_SEED else None,
+        "openness": openness,
+    }
+
+
+def save_maze(maze: Maze, path) -> None:
+    """
+    Write `maze` to `path` in the binary maze format.
+    """
+    with open(path, "wb") as f:
+        f.write(_pack_header(
+            maze.height, maze.width, maze.start, maze.goal,
+            maze.seed, maze.openness,
+        ))
+        np.ascontiguousarray(maze.wall_grid(), dtype=np.uint8).tofile(f)
+
+
+def save_rows(path, height: int, width: int, rows, start=(0, 0), goal=None,
+              seed: int | None = None, openness: float = 0.0) -> None:
+    """
+    Write a maze file from an iterable of wall-grid rows, one row in
+    memory at a time. Goal defaults to the bottom-right cell as in Maze.
+    """
+    if goal is None:
+        goal = (height - 1, width - 1)
+
+    written = 0
+    with open(path, "wb") as f:
+        f.write(_pack_header(height, width, start, goal, seed, openness))
+        for row in rows:
+            row = np.ascontiguousarray(row, dtype=np.uint8)
+            if row.shape != (width,):
+                raise ValueError(f"Row {written} has shape {row.shape}, expected ({width},).")
+            row.tofile(f)
+            written += 1
+
+    if written != height:
+        raise ValueError(f"Expected {height} rows, got {written}.")
+
+
+def load_maze(path, mmap_mode: str | None = "c") -> Maze:
+    """
+    Load a maze written by save_maze.
+
+    With the default mmap_mode="c" the wall section is memory-mapped
+    copy-on-write: opening is O(1) and wall edits stay private to this
+    process. Use "r" for a strictly read-only view, or None to read
+    the grid fully into memory.
+    """
+    info = read_header(path)
+    h, w = info["height"], info["width"]
+
+    if mmap_mode is None:
+        with open(path, "rb") as f:
+            f.seek(HEADER_SIZE)
+            walls = np.fromfile(f, dtype=np.uint8, count=h * w)
+        if walls.size != h * w:
+            raise ValueError(f"{path}: truncated wall section.")
+        walls = walls.reshape(h, w)
+    else:
+        walls = np.memmap(path, dtype=np.uint8, mode=mmap_mode,
+                          offset=HEADER_SIZE, shape=(h, w))
+
+    return Maze(
+        h, w,
+        start=info["start"],
+        goal=info["goal"],
+        walls=walls,
+        seed=info["seed"],
+        openness=info["openness"],
+    )
@@ -0,0 +1,157 @@
+"""
+Author: Priyansh Nayak
+Description: ARA* (anytime repairing A*) solver for the Maze
+    a fast weighted-A* path first, then progressively better ones
+"""
+
+import time
+import heapq
+from array import array
+from src.solvers.astar import heuristic_table, check_tie_break
+from src.solvers.utils import check_trace, package_trace
+
+
+def ara_star_solver(maze, heuristic, weights=(3.0, 2.0, 1.5, 1.25, 1.0), time_budget=None,
+                    tie_break="deep", trace="full"):
+    """
+    Runs weighted A* with each weight in turn (descending, ending at 1
+    for an optimal path), reusing the previous search: cells whose cost
+    improved after they were expanded are queued again (the INCONS
+    list) rather than starting from scratch.
+
+    time_budget: seconds; once it runs out the best path so far is
+    returned, and "weight" is the smallest weight whose search finished
+    (the path is at most that many times longer than optimal). The
+    first path is always completed, however long it takes.
+    Each strictly shorter path is recorded in "improvements" with its
+    weight, length, the expansions since the previous one and the time
+    it was found at.
+    tie_break: "fifo" or "deep" (see src.solvers.astar.TIE_BREAKS)
+    trace: "none", "compact" or "full" (see src.solvers.utils.TRACE_LEVELS)
+    """
+    check_trace(trace)
+    check_tie_break(tie_break)
+    weights = sorted(weights, reverse=True)
+    if not weights or weights[-1] < 1:
+        raise ValueError("ARA* needs weights of at least 1.")
+
+    start_time = time.perf_counter()
+    n = maze.height * maze.width
+    start = maze.cell_id(maze.start)
+    goal = maze.cell_id(maze.goal)
+    offsets, targets = maze.adjacency_lists()
+    h = heuristic_table(maze, heuristic)
+    deep = tie_break == "deep"
+
+    g = array("i", [-1]) * n # best-known cost from start (-1 = unseen)
+    parent = array("i", [-1]) * n
+    closed = bytearray(n) # expanded during the current weight's search
+    queued = bytearray(n) # in the open list
+    incons = [] # improved after being expanded, held for the next weight
+    open_set = [] # (f, tie, cell); entries are stale unless f matches the current key
+    tie_breaker = 0
+    # metrics
+    nodes_expanded = 0
+    memory_usage = 1
+    improvements = []
+    visited = bytearray(n) # expanded under any weight
+    explored_order = array("i") if trace != "none" else None
+
+    def key(cell, w):
+        f = g[cell] + w * h[cell]
+        return (f, -g[cell]) if deep else (f, tie_breaker)
+
+    g[start] = 0
+    queued[start] = 1
+    heapq.heappush(open_set, (*key(start, weights[0]), start))
+
+    best_path = []
+    bound = None # smallest weight whose search finished: path <= bound * optimal
+    out_of_time = False
+    expanded_before = 0
+    for i, w in enumerate(weights):
+        if i > 0:
+            # new weight: re-key the open list and fold INCONS back in
+            for cell in incons:
+                queued[cell] = 1
+            incons = []
+            open_set = [(*key(c, w), c) for c in range(n) if queued[c]]
+            heapq.heapify(open_set)
+            closed = bytearray(n)
+
+        while open_set:
+            f, _, current = open_set[0]
+            if not queued[current] or f != g[current] + w * h[current]:
+                heapq.heappop(open_set) # stale entry
+                continue
+            # done once no queued cell could still improve the goal
+            if g[goal] >= 0 and g[goal] <= f:
+                break
+            if time_budget is not None and best_path and time.perf_counter() - start_time > time_budget:
+                out_of_time = True
+                break
+
+            heapq.heappop(open_set)
+            queued[current] = 0
+            closed[current] = 1
+            visited[current] = 1
+            nodes_expanded += 1
+            if explored_order is not None:
+                explored_order.append(current)
+
+            tentative_g = g[current] + 1  # each move costs 1
+            for k in range(offsets[current], offsets[current + 1]):
+                nbr = targets[k]
+                old_g = g[nbr]
+                if old_g < 0 or tentative_g < old_g:
+                    g[nbr] = tentative_g
+                    parent[nbr] = current
+                    if closed[nbr]:
+                        if not queued[nbr]:
+                            incons.append(nbr)
+                    else:
+                        queued[nbr] = 1
+                        tie_breaker += 1
+                        heapq.heappush(open_set, (*key(nbr, w), nbr))
+
+            memory_usage = max(memory_usage, len(open_set) + len(incons))
+
+        if out_of_time or g[goal] < 0:
+            break # out of time, or the goal is unreachable
+        bound = w
+
+        if best_path and g[goal] >= len(best_path) - 1:
+            continue # no better than the path already published
+
+        # publish the improved path
+        path = []
+        cur = goal
+        while cur != start:
+            path.append(cur)
+            cur = parent[cur]
+        path.append(start)
+        path.reverse()
+        best_path = [maze.cell_at(i) for i in path]
+        improvements.append({
+            "weight": w,
+            "moves": len(path) - 1,
+            "nodes_expanded": nodes_expanded - expanded_before,
+            "elapsed": time.perf_counter() - start_time,
+        })
+        expanded_before = nodes_expanded
+
+    runtime = time.perf_counter() - start_time
+
+    explored, explored_order = package_trace(maze, trace, visited, explored_order)
+
+    return {
+        "path": best_path,
+        "moves": max(0, len(best_path) - 1),
+        "nodes_expanded": nodes_expanded,
+        "runtime": runtime,
+        "memory": memory_usage,
+        "weight": bound,
+        "improvements": improvements,
+        "explored": explored,
+        "explored_order": explored_order
+    }
@@ -5,7 +5,10 @@ Description: A* solver for the Maze
 """
 
 import time
-import heapq
+from array import array
+import numpy as np
+from src.solvers.queues import OPEN_LISTS, BucketQueue
+from src.solvers.utils import check_trace, package_trace
 
 
 def manhattan(a, b) -> float:
@@ -16,63 +19,139 @@ def euclidean(a, b) -> float:
     return ((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2) ** 0.5
 
 
-def astar_solver(maze, heuristic):
+def heuristic_table(maze, heuristic, weight=1.0) -> array:
+    """
+    weight * h(cell, goal) for every flat cell id, computed once per solve.
+    Manhattan and Euclidean are vectorized, as is any heuristic object
+    with a table(maze) method (e.g. Landmarks); any other heuristic is
+    called once per cell.
+    """
+    n = maze.height * maze.width
+    gr, gc = maze.goal
+
+    if heuristic is manhattan or heuristic is euclidean:
+        rows, cols = np.divmod(np.arange(n), maze.width)
+        dr, dc = rows - gr, cols - gc
+        if heuristic is manhattan:
+            table = (np.abs(dr) + np.abs(dc)).astype(np.float64)
+        else:
+            table = np.sqrt((dr * dr + dc * dc).astype(np.float64))
+    elif hasattr(heuristic, "table"):
+        table = np.asarray(heuristic.table(maze), dtype=np.float64)
+    else:
+        goal = maze.goal
+        table = np.fromiter(
+            (heuristic(maze.cell_at(i), goal) for i in range(n)),
+            dtype=np.float64, count=n,
+        )
+
+    if weight != 1:
+        table = table * weight
+
+    return array("d", table.tobytes())
+
+
+# how equal-f entries leave the open list:
+#   "fifo" in the queue's own order (oldest first for "heap")
+#   "deep" larger g first, which cuts through plateaus of equal f
+TIE_BREAKS = ("fifo", "deep")
+
+
+def check_tie_break(tie_break):
+    if tie_break not in TIE_BREAKS:
+        raise ValueError(f"Invalid tie break: {tie_break} (expected one of {TIE_BREAKS})")
+
+
+def astar_solver(maze, heuristic, open_list="heap", trace="full", weight=1.0, tie_break="fifo"):
+    """
+    open_list: "heap" (heapq, lazy deletion), "bucket" (Dial's bucket
+    queue, integer f only) or "indexed" (binary heap with decrease-key),
+    or any class from src.solvers.queues taking the number of cells.
+    trace: "none", "compact" or "full" (see src.solvers.utils.TRACE_LEVELS)
+    weight: weighted A*, f = g + weight * h. Above 1 it expands fewer
+    cells and the path is at most `weight` times longer than optimal.
+    tie_break: "fifo" or "deep" (see TIE_BREAKS); "deep" needs a heap
+    open list, the bucket queue already pops its newest cells first.
+    """
+    check_trace(trace)
+    check_tie_break(tie_break)
+    if weight < 1:
+        raise ValueError(f"Weight must be at least 1, got {weight}.")
     start_time = time.perf_counter()
-    start = maze.start
-    goal = maze.goal
-    open_set = [] # f = g + h
-    tie_breaker = 0 # avoids comparing cells when f is equal
-    g = {start: 0} # best-known cost from start to cell
-    parent = {} # for path reconstruction
-    closed_set = set() # tracks nodes fully expanded
+    # work on flat cell ids over the maze's CSR adjacency,
+    # with flat preallocated buffers instead of dicts keyed by cells
+    n = maze.height * maze.width
+    start = maze.cell_id(maze.start)
+    goal = maze.cell_id(maze.goal)
+    offsets, targets = maze.adjacency_lists()
+    h = heuristic_table(maze, heuristic, weight)
+    deep = tie_break == "deep"
+
+    queue_cls = OPEN_LISTS[open_list] if isinstance(open_list, str) else open_list
+    if deep and queue_cls is BucketQueue:
+        raise ValueError("tie_break='deep' needs a heap open list.")
+    open_set = queue_cls(n) # f = g + h
+    push, pop = open_set.push, open_set.pop
+    g = array("i", [-1]) * n # best-known cost from start to cell (-1 = unseen)
+    parent = array("i", [-1]) * n # for path reconstruction
+    closed = bytearray(n) # tracks nodes fully expanded
     # metrics
     nodes_expanded = 0
+    stale_pops = 0 # outdated duplicate entries popped and skipped
     memory_usage = 1
-    explored_order = [] # for pygame
+    explored_order = array("i") if trace != "none" else None # for pygame
 
-    start_f = heuristic(start, goal)
-    heapq.heappush(open_set, (start_f, tie_breaker, start))
+    g[start] = 0
+    push((h[start], 0) if deep else h[start], start)
 
     while open_set:
-        _, _, current = heapq.heappop(open_set)
+        current = pop()
         # if already expanded it via a better route, skip
-        if current in closed_set:
+        if closed[current]:
+            stale_pops += 1
             continue
-        closed_set.add(current)
+        closed[current] = 1
         nodes_expanded += 1
-        explored_order.append(current)
+        if explored_order is not None:
+            explored_order.append(current)
         if current == goal:
             break
-        for nbr in maze.neighbors(current):
-            tentative_g = g[current] + 1  # each move costs 1
+        tentative_g = g[current] + 1  # each move costs 1
+        for k in range(offsets[current], offsets[current + 1]):
+            nbr = targets[k]
             # if this route is better, record it
-            if nbr not in g or tentative_g < g[nbr]:
+            old_g = g[nbr]
+            if old_g < 0 or tentative_g < old_g:
                 g[nbr] = tentative_g
                 parent[nbr] = current
-                tie_breaker += 1
-                f = tentative_g + heuristic(nbr, goal)
-                heapq.heappush(open_set, (f, tie_breaker, nbr))
+                f = tentative_g + h[nbr]
+                # (f, -g) keys: equal f pops the deeper cell first
+                push((f, -tentative_g) if deep else f, nbr)
 
         memory_usage = max(memory_usage, len(open_set))
 
     # reconstruct path
     path = []
-    if goal in closed_set:
+    if closed[goal]:
         cur = goal
         while cur != start:
             path.append(cur)
             cur = parent[cur]
         path.append(start)
         path.reverse()
+    path = [maze.cell_at(i) for i in path]
 
     runtime = time.perf_counter() - start_time
 
+    explored, explored_order = package_trace(maze, trace, closed, explored_order)
+
     return {
         "path": path,
         "moves": max(0, len(path) - 1),
         "nodes_expanded": nodes_expanded,
         "runtime": runtime,
         "memory": memory_usage,
-        "explored": closed_set,
+        "stale_pops": stale_pops,
+        "explored": explored,
         "explored_order": explored_order
-    }
\ No newline at end of file
+    }
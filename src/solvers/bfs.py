@@ -4,35 +4,45 @@ Description: BFS Solver for my Maze
 """
 
 import time
+from array import array
 from collections import deque
+from src.solvers.utils import check_trace, package_trace
 
 
-def bfs_solver(maze):
+def bfs_solver(maze, trace="full"):
+    # trace: "none", "compact" or "full" (see src.solvers.utils.TRACE_LEVELS)
+    check_trace(trace)
     start_time = time.perf_counter()
 
-    start = maze.start
-    goal = maze.goal
+    # work on flat cell ids over the maze's CSR adjacency
+    n = maze.height * maze.width
+    start = maze.cell_id(maze.start)
+    goal = maze.cell_id(maze.goal)
+    offsets, targets = maze.adjacency_lists()
 
     queue = deque([start])
-    visited = {start}
-    parent = {}
+    visited = bytearray(n)
+    visited[start] = 1
+    parent = array("i", [-1]) * n
 
     nodes_expanded = 0
     memory_usage = 1
 
-    explored_order = [] # for pygame
+    explored_order = array("i") if trace != "none" else None # for pygame
 
     while queue:
         current = queue.popleft()  # FIFO
         nodes_expanded += 1
-        explored_order.append(current)
+        if explored_order is not None:
+            explored_order.append(current)
 
         if current == goal:
             break
 
-        for nbr in maze.neighbors(current):
-            if nbr not in visited:
-                visited.add(nbr)
+        for k in range(offsets[current], offsets[current + 1]):
+            nbr = targets[k]
+            if not visited[nbr]:
+                visited[nbr] = 1
                 parent[nbr] = current
                 queue.append(nbr)
 
@@ -40,22 +50,25 @@ def bfs_solver(maze):
 
     # reconstruct path
     path = []
-    if goal in visited:
+    if visited[goal]:
         cur = goal
         while cur != start:
             path.append(cur)
             cur = parent[cur]
         path.append(start)
         path.reverse()
+    path = [maze.cell_at(i) for i in path]
 
     runtime = time.perf_counter() - start_time
 
+    explored, explored_order = package_trace(maze, trace, visited, explored_order)
+
     return {
         "path": path,
         "moves": max(0, len(path) - 1),
         "nodes_expanded": nodes_expanded,
         "runtime": runtime,
         "memory": memory_usage,
-        "explored": visited,
+        "explored": explored,
         "explored_order": explored_order
     }
\ No newline at end of file
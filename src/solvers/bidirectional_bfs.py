@@ -0,0 +1,104 @@
+"""
+Author: Priyansh Nayak
+Description: Bidirectional BFS Solver for my Maze
+    grows frontiers from start and goal until they meet
+"""
+
+import time
+from array import array
+from src.solvers.utils import check_trace, package_trace
+
+
+def bidirectional_bfs_solver(maze, trace="full"):
+    # trace: "none", "compact" or "full" (see src.solvers.utils.TRACE_LEVELS)
+    check_trace(trace)
+    start_time = time.perf_counter()
+
+    # work on flat cell ids over the maze's CSR adjacency
+    start = maze.cell_id(maze.start)
+    goal = maze.cell_id(maze.goal)
+    offsets, targets = maze.adjacency_lists()
+
+    # one side per direction: parents double as the visited set
+    parent_f, parent_b = {start: None}, {goal: None}
+    dist_f, dist_b = {start: 0}, {goal: 0}
+    front_f, front_b = [start], [goal]
+
+    nodes_expanded = 0
+    memory_usage = 1
+
+    explored_order = array("i") if trace != "none" else None # for pygame
+
+    # best meeting cell (reached from both sides) and its path length
+    meet = start if start == goal else None
+    best = 0 if start == goal else float("inf")
+
+    while meet is None and front_f and front_b:
+        # grow the smaller frontier by one whole level
+        if len(front_f) <= len(front_b):
+            front, parents, dist, other, other_dist = front_f, parent_f, dist_f, parent_b, dist_b
+            forward = True
+        else:
+            front, parents, dist, other, other_dist = front_b, parent_b, dist_b, parent_f, dist_f
+            forward = False
+
+        next_front = []
+        for current in front:
+            nodes_expanded += 1
+            if explored_order is not None:
+                explored_order.append(current)
+
+            for k in range(offsets[current], offsets[current + 1]):
+                nbr = targets[k]
+                if nbr in parents:
+                    continue
+                parents[nbr] = current
+                dist[nbr] = dist[current] + 1
+                next_front.append(nbr)
+
+                # frontiers touched: finish the level, keep the shortest join
+                if nbr in other:
+                    length = dist[nbr] + other_dist[nbr]
+                    if length < best:
+                        best = length
+                        meet = nbr
+
+        if forward:
+            front_f = next_front
+        else:
+            front_b = next_front
+
+        memory_usage = max(memory_usage, len(front_f) + len(front_b))
+
+    # reconstruct path: start -> meeting cell -> goal
+    path = []
+    if meet is not None:
+        cur = meet
+        while cur is not None:
+            path.append(cur)
+            cur = parent_f[cur]
+        path.reverse()
+        cur = parent_b[meet]
+        while cur is not None:
+            path.append(cur)
+            cur = parent_b[cur]
+    path = [maze.cell_at(i) for i in path]
+
+    runtime = time.perf_counter() - start_time
+
+    visited = None
+    if trace != "none":
+        visited = bytearray(maze.height * maze.width)
+        for i in parent_f.keys() | parent_b.keys():
+            visited[i] = 1
+    explored, explored_order = package_trace(maze, trace, visited, explored_order)
+
+    return {
+        "path": path,
+        "moves": max(0, len(path) - 1),
+        "nodes_expanded": nodes_expanded,
+        "runtime": runtime,
+        "memory": memory_usage,
+        "explored": explored,
+        "explored_order": explored_order
+    }
@@ -0,0 +1,212 @@
+"""
+Author: Priyansh Nayak
+Description: A* and Value Iteration on the corridor-contracted
+    graph of a Maze, with results expanded back to full cells
+"""
+
+import time
+import heapq
+from array import array
+from src.maze.corridors import CorridorGraph
+from src.solvers.utils import check_trace, package_trace
+
+
+def astar_contracted(maze, heuristic, graph=None, trace="full"):
+    # trace: "none", "compact" or "full", over the expanded node cells
+    check_trace(trace)
+    # graph construction counts towards runtime unless one is passed in
+    start_time = time.perf_counter()
+    if graph is None:
+        graph = CorridorGraph(maze)
+
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    start = graph.node_of[graph.start]
+    goal = graph.node_of[graph.goal]
+    goal_cell = maze.goal
+
+    open_set = [] # f = g + h
+    tie_breaker = 0
+    g = {start: 0}
+    parent = {} # node -> (previous node, edge taken)
+    closed_set = set()
+    # metrics
+    nodes_expanded = 0
+    memory_usage = 1
+    explored_order = array("i") if trace != "none" else None
+
+    heapq.heappush(open_set, (heuristic(maze.start, goal_cell), tie_breaker, start))
+
+    while open_set:
+        _, _, current = heapq.heappop(open_set)
+        if current in closed_set:
+            continue
+        closed_set.add(current)
+        nodes_expanded += 1
+        if explored_order is not None:
+            explored_order.append(graph.nodes[current])
+        if current == goal:
+            break
+        for e in range(offsets[current], offsets[current + 1]):
+            nbr = targets[e]
+            tentative_g = g[current] + weights[e] # corridor length
+            if nbr not in g or tentative_g < g[nbr]:
+                g[nbr] = tentative_g
+                parent[nbr] = (current, e)
+                tie_breaker += 1
+                f = tentative_g + heuristic(maze.cell_at(graph.nodes[nbr]), goal_cell)
+                heapq.heappush(open_set, (f, tie_breaker, nbr))
+
+        memory_usage = max(memory_usage, len(open_set))
+
+    # reconstruct edge walk, then expand corridors back into cells
+    path = []
+    if goal in closed_set:
+        edges = []
+        cur = goal
+        while cur != start:
+            cur, e = parent[cur]
+            edges.append(e)
+        edges.reverse()
+        path = graph.expand_path(edges)
+
+    runtime = time.perf_counter() - start_time
+
+    visited = None
+    if trace != "none":
+        visited = bytearray(maze.height * maze.width)
+        for i in explored_order:
+            visited[i] = 1
+    explored, explored_order = package_trace(maze, trace, visited, explored_order)
+
+    return {
+        "path": path,
+        "moves": max(0, len(path) - 1),
+        "nodes_expanded": nodes_expanded,
+        "runtime": runtime,
+        "memory": memory_usage,
+        "explored": explored,
+        "explored_order": explored_order,
+        "graph_nodes": len(graph),
+    }
+
+
+def value_iteration_contracted(maze, gamma=0.9, goal_reward=100, step_cost=-1, graph=None):
+    """
+    Value iteration over corridor-graph nodes. Taking an edge of weight w
+    is a w-step macro action: reward is the discounted sum of its steps
+    and the successor is discounted by gamma ** w. This matches the full
+    MDP whenever moving is not itself rewarded (step_cost <= 0).
+    Values and policy are expanded back to every cell.
+    """
+    start_time = time.time()
+    if graph is None:
+        graph = CorridorGraph(maze)
+
+    m = len(graph)
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    goal = graph.node_of[graph.goal]
+
+    # returns[s]: discounted step costs of the first s - 1 moves
+    longest = max(weights, default=1)
+    returns = [0.0] * (longest + 1)
+    for s in range(2, longest + 1):
+        returns[s] = returns[s - 1] + gamma ** (s - 2) * step_cost
+
+    def macro_reward(steps, target):
+        last = goal_reward if target == goal else step_cost
+        return returns[steps] + gamma ** (steps - 1) * last
+
+    edge_reward = [macro_reward(weights[e], targets[e]) for e in range(len(targets))]
+    edge_discount = [gamma ** w for w in weights]
+
+    V = [0] * m
+
+    # metrics
+    iterations = 0
+    state_updates = 0
+    final_delta = 0
+
+    while True:
+        delta = 0
+        new_V = V[:]
+
+        for state in range(m):
+            if state == goal:
+                continue
+
+            lo, hi = offsets[state], offsets[state + 1]
+            if lo == hi:
+                continue
+
+            best_value = float("-inf")
+            for e in range(lo, hi):
+                value = edge_reward[e] + edge_discount[e] * V[targets[e]]
+                if value > best_value:
+                    best_value = value
+
+            new_V[state] = best_value
+            state_updates += 1
+            delta = max(delta, abs(new_V[state] - V[state]))
+
+        V = new_V
+        iterations += 1
+        final_delta = delta
+
+        if delta < 1e-4:
+            break
+
+    # expand to per-cell values and policy
+    cell_value = {}
+    cell_policy = {}
+
+    for state in range(m):
+        cid = graph.nodes[state]
+        best_edge = None
+        best_value = float("-inf")
+        if state != goal:
+            for e in range(offsets[state], offsets[state + 1]):
+                value = edge_reward[e] + edge_discount[e] * V[targets[e]]
+                if value > best_value:
+                    best_value = value
+                    best_edge = e
+        cell_value[cid] = V[state]
+        if best_edge is None:
+            cell_policy[cid] = None
+        else:
+            chain = graph.chains[best_edge]
+            cell_policy[cid] = chain[0] if chain else graph.nodes[targets[best_edge]]
+
+        # corridor cells: compare heading to this edge's far end against
+        # the reverse edge, which is visited from the other node
+        for e in range(offsets[state], offsets[state + 1]):
+            chain = graph.chains[e]
+            target = targets[e]
+            end = graph.nodes[target]
+            length = len(chain)
+            for i, cid in enumerate(chain):
+                steps = length - i
+                value = macro_reward(steps, target) + gamma ** steps * V[target]
+                if cid not in cell_value or value > cell_value[cid]:
+                    cell_value[cid] = value
+                    cell_policy[cid] = chain[i + 1] if i + 1 < length else end
+
+    policy = {}
+    values = {}
+    for cid in range(maze.height * maze.width):
+        cell = maze.cell_at(cid)
+        nxt = cell_policy.get(cid)
+        policy[cell] = None if nxt is None else maze.cell_at(nxt)
+        values[cell] = cell_value.get(cid, 0)
+
+    runtime = time.time() - start_time
+
+    return {
+        "policy": policy,
+        "values": values,
+        "iterations": iterations,
+        "state_updates": state_updates,
+        "runtime": runtime,
+        "memory": len(V),
+        "delta": final_delta,
+        "graph_nodes": m,
+    }
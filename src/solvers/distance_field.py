@@ -0,0 +1,120 @@
+"""
+Author: Priyansh Nayak
+Description: Goal-rooted distance field for the Maze.
+    One reverse BFS from the goal answers shortest-path
+    queries from any start in O(path length).
+"""
+
+import time
+from array import array
+from src.solvers.utils import check_trace, package_trace
+
+
+class DistanceField:
+    """
+    BFS distance to `goal` for every flat cell id (-1 = unreachable),
+    stored as one array('i'). A shortest path from any cell follows
+    strictly descending distance, first matching neighbour in N, E, S, W
+    order. order holds the reachable cells in BFS expansion order.
+    """
+
+    def __init__(self, maze, goal=None):
+        self.maze = maze
+        self.goal = maze.goal if goal is None else goal
+        n = maze.height * maze.width
+        offsets, targets = maze.adjacency_lists()
+
+        goal_id = maze.cell_id(self.goal)
+        dist = array("i", [-1]) * n
+        dist[goal_id] = 0
+        frontier = [goal_id]
+        order = array("i")
+        expanded = 0
+
+        # level-by-level reverse BFS (moves are symmetric)
+        while frontier:
+            next_frontier = []
+            order.extend(frontier)
+            for current in frontier:
+                expanded += 1
+                d = dist[current] + 1
+                for k in range(offsets[current], offsets[current + 1]):
+                    nbr = targets[k]
+                    if dist[nbr] < 0:
+                        dist[nbr] = d
+                        next_frontier.append(nbr)
+            frontier = next_frontier
+
+        self.dist = dist
+        self.order = order
+        self.nodes_expanded = expanded
+
+    def distance(self, cell) -> int:
+        """Moves from `cell` to the goal, or -1 if it cannot be reached."""
+        return self.dist[self.maze.cell_id(cell)]
+
+    def path_from(self, start):
+        """Shortest path from `start` to the goal as cells ([] if unreachable)."""
+        maze = self.maze
+        offsets, targets = maze.adjacency_lists()
+        dist = self.dist
+
+        cur = maze.cell_id(start)
+        if dist[cur] < 0:
+            return []
+
+        path = [cur]
+        while dist[cur] > 0:
+            want = dist[cur] - 1
+            for k in range(offsets[cur], offsets[cur + 1]):
+                if dist[targets[k]] == want:
+                    cur = targets[k]
+                    break
+            path.append(cur)
+        return [maze.cell_at(i) for i in path]
+
+
+def goal_distance_field(maze, goal=None) -> DistanceField:
+    """
+    The distance field to `goal` (default maze.goal), built on first use
+    and cached on the maze until one of its walls is removed.
+    """
+    goal = maze.goal if goal is None else goal
+    return maze.derived(("distance_field", goal), lambda m: DistanceField(m, goal))
+
+
+def distance_field_solver(maze, start=None, trace="full"):
+    """
+    trace: "none", "compact" or "full" (see src.solvers.utils.TRACE_LEVELS);
+    the explored cells are the BFS that built the field, so a query
+    answered from the cached field explores nothing.
+    """
+    check_trace(trace)
+    start_time = time.perf_counter()
+    start = maze.start if start is None else start
+
+    # only the first query on a maze pays for the BFS
+    cached = maze.has_derived(("distance_field", maze.goal))
+    field = goal_distance_field(maze)
+    path = field.path_from(start)
+
+    runtime = time.perf_counter() - start_time
+
+    visited, explored_order = None, None
+    if trace != "none":
+        visited = bytearray(len(field.dist))
+        explored_order = array("i") if cached else array("i", field.order)
+        for i in explored_order:
+            visited[i] = 1
+    explored, explored_order = package_trace(maze, trace, visited, explored_order)
+
+    return {
+        "path": path,
+        "moves": max(0, len(path) - 1),
+        "nodes_expanded": 0 if cached else field.nodes_expanded,
+        "runtime": runtime,
+        "memory": len(field.dist),
+        "explored": explored,
+        "explored_order": explored_order,
+        "field_cached": cached,
+    }
@@ -0,0 +1,291 @@
+"""
+Author: Priyansh Nayak
+Description: Hierarchical pathfinding (HPA*) for large Mazes.
+    The grid is split into square clusters; A* runs on an abstract
+    graph of cluster entrances and the result is refined to cells.
+"""
+
+import time
+import heapq
+import numpy as np
+from array import array
+from src.maze.maze import DELTAS
+from src.solvers.utils import check_trace, package_trace
+
+
+class HierarchicalPlanner:
+    """
+    Abstract graph over a maze split into cluster_size x cluster_size
+    clusters.
+
+    Maze passages are one cell wide, so every open wall between two
+    clusters is its own entrance: both cells become abstract nodes
+    ("portals") joined by a cost-1 inter-cluster edge. Portals of the
+    same cluster are joined by their BFS distance inside the cluster.
+    Any shortest path splits into such pieces, so abstract distances
+    are exact and the refined paths are shortest paths.
+
+    Nodes are flat cell ids; edges[u] maps neighbour -> cost.
+    """
+
+    def __init__(self, maze, cluster_size: int = 16):
+        if cluster_size <= 0:
+            raise ValueError("Cluster size must be a positive integer.")
+
+        self.maze = maze
+        self.cluster_size = cluster_size
+        self.cluster_rows = -(-maze.height // cluster_size)
+        self.cluster_cols = -(-maze.width // cluster_size)
+
+        rows, cols = np.divmod(np.arange(maze.height * maze.width), maze.width)
+        self.cluster_of = ((rows // cluster_size) * self.cluster_cols + cols // cluster_size).tolist()
+
+        self.portals = {}
+        self.edges = {}
+        for cluster in range(self.cluster_rows * self.cluster_cols):
+            self._build_cluster(cluster)
+
+    # -------------------------
+    # Construction / updates
+    # -------------------------
+
+    def _cluster_cells(self, cluster):
+        cs, width = self.cluster_size, self.maze.width
+        cr, cc = divmod(cluster, self.cluster_cols)
+        for r in range(cr * cs, min((cr + 1) * cs, self.maze.height)):
+            for c in range(cc * cs, min((cc + 1) * cs, width)):
+                yield r * width + c
+
+    def _cluster_adjacency(self, cluster):
+        """
+        Neighbours of every cell in `cluster`, decoded from the wall bits
+        in N, E, S, W order, split into moves that stay inside the
+        cluster (cell -> list) and moves that cross into another one
+        (cell -> {neighbour: 1}, portal cells only). Reading the bits
+        directly keeps a rebuild O(cluster area): the maze's own CSR
+        covers the whole grid and is dropped by every wall edit.
+        """
+        maze = self.maze
+        width, n = maze.width, maze.height * maze.width
+        walls = memoryview(np.ascontiguousarray(maze.walls)).cast("B")  # a view, not a copy
+        cluster_of = self.cluster_of
+
+        inside = {}
+        crossings = {}
+        for u in self._cluster_cells(cluster):
+            bits = walls[u]
+            c = u % width
+            nbrs = []
+            if not bits & 1 and u >= width:
+                nbrs.append(u - width)
+            if not bits & 2 and c < width - 1:
+                nbrs.append(u + 1)
+            if not bits & 4 and u + width < n:
+                nbrs.append(u + width)
+            if not bits & 8 and c > 0:
+                nbrs.append(u - 1)
+
+            local = []
+            for v in nbrs:
+                if cluster_of[v] == cluster:
+                    local.append(v)
+                else:
+                    crossings.setdefault(u, {})[v] = 1
+            inside[u] = local
+        return inside, crossings
+
+    def _cluster_bfs(self, source, target=None, inside=None):
+        """
+        BFS from `source` without leaving its cluster.
+        Returns the parent map (which doubles as the visited set) and
+        distances; stops early once `target` is reached.
+        inside: the cluster's in-cluster adjacency, if already decoded.
+        """
+        if inside is None:
+            inside, _ = self._cluster_adjacency(self.cluster_of[source])
+
+        parent = {source: None}
+        dist = {source: 0}
+        frontier = [source]
+        while frontier and target not in parent:
+            next_frontier = []
+            for current in frontier:
+                d = dist[current] + 1
+                for nbr in inside[current]:
+                    if nbr not in parent:
+                        parent[nbr] = current
+                        dist[nbr] = d
+                        next_frontier.append(nbr)
+            frontier = next_frontier
+        return parent, dist
+
+    def _build_cluster(self, cluster):
+        for p in self.portals.get(cluster, ()):
+            self.edges.pop(p, None)
+
+        # portals: cells with an open passage into another cluster
+        inside, crossings = self._cluster_adjacency(cluster)
+        portals = [cid for cid in self._cluster_cells(cluster) if cid in crossings]
+        for cid in portals:
+            self.edges[cid] = crossings[cid]
+
+        # intra-cluster edges between portals
+        for p in portals:
+            _, dist = self._cluster_bfs(p, inside=inside)
+            edges = self.edges[p]
+            for q in portals:
+                if q != p and q in dist:
+                    edges[q] = dist[q]
+
+        self.portals[cluster] = portals
+
+    def update_cells(self, cells) -> None:
+        """
+        Rebuild only the clusters containing `cells` (and nothing else)
+        after their walls changed (e.g. via maze.add_wall / remove_wall);
+        pass every cell whose walls changed.
+        """
+        for cluster in {self.cluster_of[self.maze.cell_id(cell)] for cell in cells}:
+            self._build_cluster(cluster)
+
+    def remove_wall(self, cell, direction) -> None:
+        """
+        Remove a maze wall and refresh the one or two affected clusters.
+        """
+        self.maze.remove_wall(cell, direction)
+        dr, dc = DELTAS[direction]
+        self.update_cells((cell, (cell[0] + dr, cell[1] + dc)))
+
+    def add_wall(self, cell, direction) -> None:
+        """
+        Add a maze wall and refresh the one or two affected clusters.
+        """
+        self.maze.add_wall(cell, direction)
+        dr, dc = DELTAS[direction]
+        self.update_cells((cell, (cell[0] + dr, cell[1] + dc)))
+
+    # -------------------------
+    # Queries
+    # -------------------------
+
+    def query(self, start, goal, explored_order=None):
+        """
+        Shortest path from `start` to `goal` as cells, plus the number of
+        abstract nodes expanded. Returns ([], n) if unreachable.
+        explored_order: optional array('i'); the flat ids of the expanded
+        abstract nodes are appended to it.
+        """
+        maze = self.maze
+        s, t = maze.cell_id(start), maze.cell_id(goal)
+        if s == t:
+            return [start], 0
+
+        cluster_of = self.cluster_of
+        gr, gc = goal
+
+        # temporary edges: start -> its cluster's portals (or straight to goal),
+        # and goal-cluster portals -> goal
+        _, ds = self._cluster_bfs(s)
+        start_edges = {p: ds[p] for p in self.portals[cluster_of[s]] if p in ds and p != s}
+        if t in ds:
+            start_edges[t] = ds[t]
+        _, dt = self._cluster_bfs(t)
+        goal_edges = {p: dt[p] for p in self.portals[cluster_of[t]] if p in dt}
+
+        # A* on the abstract graph (Manhattan is consistent: every edge
+        # costs at least the Manhattan distance between its ends)
+        g = {s: 0}
+        parent = {}
+        closed = set()
+        tie_breaker = 0
+        open_set = [(abs(gr - start[0]) + abs(gc - start[1]), tie_breaker, s)]
+        nodes_expanded = 0
+
+        while open_set:
+            _, _, current = heapq.heappop(open_set)
+            if current in closed:
+                continue
+            closed.add(current)
+            nodes_expanded += 1
+            if explored_order is not None:
+                explored_order.append(current)
+            if current == t:
+                break
+
+            out = list(self.edges.get(current, {}).items())
+            if current == s:
+                out.extend(start_edges.items())
+            if current in goal_edges:
+                out.append((t, goal_edges[current]))
+
+            for nbr, cost in out:
+                tentative_g = g[current] + cost
+                if nbr not in g or tentative_g < g[nbr]:
+                    g[nbr] = tentative_g
+                    parent[nbr] = current
+                    tie_breaker += 1
+                    r, c = divmod(nbr, maze.width)
+                    heapq.heappush(open_set, (tentative_g + abs(gr - r) + abs(gc - c), tie_breaker, nbr))
+
+        if t not in closed:
+            return [], nodes_expanded
+
+        abstract = [t]
+        while abstract[-1] != s:
+            abstract.append(parent[abstract[-1]])
+        abstract.reverse()
+
+        return [maze.cell_at(i) for i in self._refine(abstract)], nodes_expanded
+
+    def _refine(self, abstract):
+        cluster_of = self.cluster_of
+        path = [abstract[0]]
+        for a, b in zip(abstract, abstract[1:]):
+            if cluster_of[a] != cluster_of[b]:
+                path.append(b)  # inter-cluster edge: adjacent cells
+                continue
+            parent, _ = self._cluster_bfs(a, target=b)
+            segment = []
+            cur = b
+            while cur != a:
+                segment.append(cur)
+                cur = parent[cur]
+            path.extend(reversed(segment))
+        return path
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+
+def hpa_solver(maze, planner=None, cluster_size=16, trace="full"):
+    """
+    trace: "none", "compact" or "full" (see src.solvers.utils.TRACE_LEVELS);
+    the explored cells are the abstract nodes (portals) expanded.
+    """
+    check_trace(trace)
+    # building the abstract graph counts towards runtime unless one is passed in
+    start_time = time.perf_counter()
+    if planner is None:
+        planner = HierarchicalPlanner(maze, cluster_size=cluster_size)
+
+    explored_order = array("i") if trace != "none" else None
+    path, nodes_expanded = planner.query(maze.start, maze.goal, explored_order=explored_order)
+
+    runtime = time.perf_counter() - start_time
+
+    visited = None
+    if explored_order is not None:
+        visited = bytearray(maze.height * maze.width)
+        for i in explored_order:
+            visited[i] = 1
+    explored, explored_order = package_trace(maze, trace, visited, explored_order)
+
+    return {
+        "path": path,
+        "moves": max(0, len(path) - 1),
+        "nodes_expanded": nodes_expanded,
+        "runtime": runtime,
+        "memory": len(planner),
+        "explored": explored,
+        "explored_order": explored_order,
+    }
@@ -0,0 +1,150 @@
+"""
+Author: Priyansh Nayak
+Description: IDA* (iterative deepening A*) solver for the Maze
+    memory grows with path depth, not with the explored area
+"""
+
+import time
+import math
+from array import array
+import numpy as np
+from src.solvers.astar import manhattan, euclidean
+from src.solvers.utils import check_trace, package_trace
+
+INF = float("inf")
+
+
+def ida_star_solver(maze, heuristic, max_expansions=None, trace="full"):
+    """
+    Depth-first searches bounded by f = g + h, raising the bound to the
+    smallest f that exceeded it until the goal is reached. The search
+    keeps only the current path (cells, direction cursors and an on-path
+    set), so memory is O(depth); the price is re-expanding cells across
+    iterations and along different routes in mazes with loops.
+    Neighbours are decoded from the maze's wall bits in place and h is
+    computed per node, so nothing per-cell is allocated except the
+    trace (and re_expansions, which needs it: None with trace="none").
+
+    max_expansions: give up (empty path, "aborted": True) after this many
+    expansions, since IDA* can blow up on very open mazes.
+    trace: "none", "compact" or "full" (see src.solvers.utils.TRACE_LEVELS)
+    """
+    check_trace(trace)
+    start_time = time.perf_counter()
+    width = maze.width
+    n = maze.height * width
+    start = maze.cell_id(maze.start)
+    goal = maze.cell_id(maze.goal)
+    gr, gc = maze.goal
+    # a flat view of the wall grid, not a copy
+    walls = memoryview(np.ascontiguousarray(maze.walls)).cast("B")
+
+    def h(cell):
+        r, c = divmod(cell, width)
+        if heuristic is manhattan:
+            return abs(r - gr) + abs(c - gc)
+        if heuristic is euclidean:
+            return math.sqrt((r - gr) ** 2 + (c - gc) ** 2)
+        return heuristic((r, c), maze.goal)
+
+    def neighbor(u, d):
+        # d-th move out of u in N, E, S, W order, or -1 if walled off
+        if walls[u] & (1 << d):
+            return -1
+        if d == 0:
+            return u - width if u >= width else -1
+        if d == 1:
+            return u + 1 if u % width < width - 1 else -1
+        if d == 2:
+            return u + width if u + width < n else -1
+        return u - 1 if u % width > 0 else -1
+
+    # metrics
+    nodes_expanded = 0
+    iterations = 0
+    memory_usage = 1
+    aborted = False
+    # one byte per cell, only kept for the trace and re_expansions
+    expanded = bytearray(n) if trace != "none" else None
+    re_expansions = 0 if expanded is not None else None # expansions of cells already expanded earlier
+    explored_order = array("i") if trace != "none" else None
+
+    def expand(cell):
+        nonlocal nodes_expanded, re_expansions
+        nodes_expanded += 1
+        if expanded is not None:
+            if expanded[cell]:
+                re_expansions += 1
+            expanded[cell] = 1
+            explored_order.append(cell)
+
+    path = []
+    bound = h(start)
+    while True:
+        iterations += 1
+        next_bound = INF
+        found = False
+
+        # explicit DFS stack: cells on the current path and, per cell,
+        # the next direction to try
+        stack = [start]
+        cursor = [0]
+        on_path = {start}
+        expand(start)
+        if start == goal:
+            found = True
+
+        while stack and not found:
+            if max_expansions is not None and nodes_expanded >= max_expansions:
+                aborted = True
+                break
+            u = stack[-1]
+            d = cursor[-1]
+            if d == 4:
+                # all directions tried: backtrack
+                stack.pop()
+                cursor.pop()
+                on_path.discard(u)
+                continue
+            cursor[-1] = d + 1
+
+            v = neighbor(u, d)
+            if v < 0 or v in on_path:
+                continue
+            f = len(stack) + h(v) # g(v) is the depth, each move costs 1
+            if f > bound:
+                if f < next_bound:
+                    next_bound = f
+                continue
+
+            stack.append(v)
+            cursor.append(0)
+            on_path.add(v)
+            expand(v)
+            memory_usage = max(memory_usage, len(stack))
+            if v == goal:
+                found = True
+
+        if found:
+            path = [maze.cell_at(i) for i in stack]
+            break
+        if aborted or next_bound == INF:
+            break # out of budget, or the goal is unreachable
+        bound = next_bound
+
+    runtime = time.perf_counter() - start_time
+
+    explored, explored_order = package_trace(maze, trace, expanded, explored_order)
+
+    return {
+        "path": path,
+        "moves": max(0, len(path) - 1),
+        "nodes_expanded": nodes_expanded,
+        "re_expansions": re_expansions,
+        "iterations": iterations,
+        "runtime": runtime,
+        "memory": memory_usage,
+        "aborted": aborted,
+        "explored": explored,
+        "explored_order": explored_order
+    }
@@ -0,0 +1,87 @@
+"""
+Author: Priyansh Nayak
+Description: ALT (A*, Landmarks, Triangle inequality) heuristic
+    for A* on the Maze, from BFS distance tables of a few landmark cells
+"""
+
+import numpy as np
+from src.solvers.distance_field import DistanceField
+
+
+class Landmarks:
+    """
+    K landmark cells with exact BFS distances to every cell, stored as
+    one (K, n) int32 table over flat ids (-1 = unreachable).
+
+    For any cells v, t and landmark L, |d(L, t) - d(L, v)| <= d(v, t),
+    so the max over landmarks (and Manhattan distance) is an admissible,
+    consistent heuristic. Pass the object straight to astar_solver:
+    it is callable like manhattan, and table() gives every h at once.
+    """
+
+    def __init__(self, maze, k: int = 8):
+        if k <= 0:
+            raise ValueError("Need at least one landmark.")
+
+        self.maze = maze
+        n = maze.height * maze.width
+        k = min(k, n)
+
+        # farthest-point selection: start from the cell farthest from (0, 0),
+        # then repeatedly add the cell farthest from all chosen landmarks
+        seed_dist = self._bfs(maze.cell_at(0))
+        nearest = np.where(seed_dist >= 0, seed_dist, -1)
+
+        cells = []
+        rows = []
+        for _ in range(k):
+            cid = int(np.argmax(nearest))
+            if cells and nearest[cid] <= 0:
+                break  # every reachable cell is already a landmark
+            dist = self._bfs(maze.cell_at(cid))
+            cells.append(cid)
+            rows.append(dist)
+            reach = dist >= 0
+            nearest = np.where(reach, np.minimum(nearest, dist), nearest)
+            nearest[cid] = 0
+
+        self.cells = cells
+        self.dist = np.vstack(rows)
+
+    def _bfs(self, cell) -> np.ndarray:
+        field = DistanceField(self.maze, goal=cell)
+        return np.frombuffer(field.dist, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __call__(self, a, b) -> float:
+        maze = self.maze
+        da = self.dist[:, maze.cell_id(a)]
+        db = self.dist[:, maze.cell_id(b)]
+        ok = (da >= 0) & (db >= 0)
+        alt = int(np.abs(da[ok] - db[ok]).max(initial=0))
+        return max(alt, abs(a[0] - b[0]) + abs(a[1] - b[1]))
+
+    def table(self, maze, goal=None) -> np.ndarray:
+        """
+        h(v, goal) for every flat id v, vectorized over all landmarks.
+        """
+        if maze is not self.maze:
+            raise ValueError("Landmarks were built for a different maze.")
+        goal = maze.goal if goal is None else goal
+        gr, gc = goal
+
+        dg = self.dist[:, maze.cell_id(goal)][:, None]
+        ok = (self.dist >= 0) & (dg >= 0)
+        alt = np.where(ok, np.abs(self.dist - dg), 0).max(axis=0)
+
+        rows, cols = np.divmod(np.arange(maze.height * maze.width), maze.width)
+        return np.maximum(alt, np.abs(rows - gr) + np.abs(cols - gc)).astype(np.float64)
+
+
+def maze_landmarks(maze, k: int = 8) -> Landmarks:
+    """
+    Landmarks for `maze`, built once and cached on it until a wall is removed.
+    """
+    return maze.derived(("landmarks", k), lambda m: Landmarks(m, k))
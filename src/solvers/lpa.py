@@ -0,0 +1,240 @@
+"""
+Author: Priyansh Nayak
+Description: Lifelong Planning A* (LPA*) for the Maze.
+    Keeps its search state between solves and, after wall edits,
+    repairs only the g/rhs values the change actually affects.
+"""
+
+import time
+import heapq
+from array import array
+from src.maze.maze import DELTAS
+from src.solvers.astar import heuristic_table
+from src.solvers.utils import check_trace, package_trace
+
+INF = float("inf")
+
+
+class IncrementalAStar:
+    """
+    LPA* from maze.start to maze.goal over flat cell ids.
+
+    g[u] is the cost found by the last search, rhs[u] the one-step
+    lookahead min(g[v] + 1) over u's neighbours. Cells with g != rhs
+    are inconsistent and sit in the open list keyed by
+    (min(g, rhs) + h, min(g, rhs)). A solve only processes inconsistent
+    cells that can still matter for the goal, so after a small edit it
+    touches little more than the region whose distances changed.
+
+    The planner keeps its own copy of the wall bits; make edits through
+    its add_wall() / remove_wall(), or edit with maze.add_wall() /
+    maze.remove_wall() and pass the changed cells to update_cells().
+    The heuristic must stay admissible after edits (Manhattan and
+    Euclidean always do). If maze.start or maze.goal change, the search
+    restarts from scratch.
+    """
+
+    def __init__(self, maze, heuristic):
+        self.maze = maze
+        self.heuristic = heuristic
+        self._reset()
+
+    def _reset(self):
+        maze = self.maze
+        n = maze.height * maze.width
+        self.start = maze.cell_id(maze.start)
+        self.goal = maze.cell_id(maze.goal)
+        self.h = heuristic_table(maze, self.heuristic)
+        self.walls = bytearray(maze.walls.tobytes())
+
+        self.g = array("d", [INF]) * n
+        self.rhs = array("d", [INF]) * n
+        self.rhs[self.start] = 0.0
+        # lazy heap: an entry is live only while it matches the cell's current key
+        self.open_set = [(self.h[self.start], 0.0, self.start)]
+        self.solves = 0
+
+    def _neighbors(self, u: int):
+        # decode the wall bits directly, so edits never wait on a CSR rebuild
+        width, n = self.maze.width, len(self.g)
+        bits = self.walls[u]
+        c = u % width
+        if not bits & 1 and u >= width:
+            yield u - width
+        if not bits & 2 and c < width - 1:
+            yield u + 1
+        if not bits & 4 and u + width < n:
+            yield u + width
+        if not bits & 8 and c > 0:
+            yield u - 1
+
+    def _key(self, u: int):
+        k = min(self.g[u], self.rhs[u])
+        return (k + self.h[u], k)
+
+    def _update_vertex(self, u: int) -> None:
+        g, rhs = self.g, self.rhs
+        if u != self.start:
+            rhs[u] = min((g[v] + 1 for v in self._neighbors(u)), default=INF)
+        if g[u] != rhs[u]:
+            k1, k2 = self._key(u)
+            heapq.heappush(self.open_set, (k1, k2, u))
+
+    def _top(self):
+        # drop stale entries until the head is a live one (or the list is empty)
+        open_set, g, rhs = self.open_set, self.g, self.rhs
+        while open_set:
+            k1, k2, u = open_set[0]
+            if g[u] != rhs[u] and (k1, k2) == self._key(u):
+                return open_set[0]
+            heapq.heappop(open_set)
+        return None
+
+    # -------------------------
+    # Edits
+    # -------------------------
+
+    def update_cells(self, cells) -> None:
+        """
+        Re-read the walls of `cells` from the maze and repair the search
+        around them. Pass every cell whose walls changed (both sides of a
+        removed or added wall).
+        """
+        maze = self.maze
+        if maze.cell_id(maze.start) != self.start or maze.cell_id(maze.goal) != self.goal:
+            self._reset()
+            return
+
+        touched = set()
+        for cell in cells:
+            u = maze.cell_id(cell)
+            r, c = cell
+            self.walls[u] = int(maze.walls[r, c])
+            touched.add(u)
+        # a changed wall changes the lookahead on both of its sides,
+        # including neighbours that just lost a passage to u
+        affected = set(touched)
+        width, n = maze.width, len(self.g)
+        for u in touched:
+            c = u % width
+            if u >= width:
+                affected.add(u - width)
+            if c < width - 1:
+                affected.add(u + 1)
+            if u + width < n:
+                affected.add(u + width)
+            if c > 0:
+                affected.add(u - 1)
+        for u in affected:
+            self._update_vertex(u)
+
+    def remove_wall(self, cell, direction) -> None:
+        """
+        Remove a maze wall and repair the search around it.
+        """
+        self.maze.remove_wall(cell, direction)
+        dr, dc = DELTAS[direction]
+        self.update_cells((cell, (cell[0] + dr, cell[1] + dc)))
+
+    def add_wall(self, cell, direction) -> None:
+        """
+        Add a maze wall and repair the search around it.
+        """
+        self.maze.add_wall(cell, direction)
+        dr, dc = DELTAS[direction]
+        self.update_cells((cell, (cell[0] + dr, cell[1] + dc)))
+
+    # -------------------------
+    # Search
+    # -------------------------
+
+    def solve(self, trace="full"):
+        """
+        Bring the goal's g-value up to date and return the standard
+        result dict. The first call is a plain A*; later calls only
+        process cells made inconsistent since the previous one.
+        """
+        check_trace(trace)
+        maze = self.maze
+        if maze.cell_id(maze.start) != self.start or maze.cell_id(maze.goal) != self.goal:
+            self._reset()
+
+        start_time = time.perf_counter()
+        g, rhs = self.g, self.rhs
+        goal = self.goal
+        update_vertex = self._update_vertex
+        # metrics
+        nodes_expanded = 0
+        memory_usage = len(self.open_set)
+        explored_order = array("i") if trace != "none" else None
+
+        while True:
+            top = self._top()
+            if top is None:
+                break
+            if (top[0], top[1]) >= self._key(goal) and rhs[goal] == g[goal]:
+                break
+            u = heapq.heappop(self.open_set)[2]
+            nodes_expanded += 1
+            if explored_order is not None:
+                explored_order.append(u)
+
+            if g[u] > rhs[u]:
+                # overconsistent: settle it, like an A* expansion
+                g[u] = rhs[u]
+                for v in self._neighbors(u):
+                    update_vertex(v)
+            else:
+                # underconsistent: its old cost is gone, re-derive it and its dependants
+                g[u] = INF
+                update_vertex(u)
+                for v in self._neighbors(u):
+                    update_vertex(v)
+
+            memory_usage = max(memory_usage, len(self.open_set))
+
+        # walk back from the goal through the cheapest neighbour
+        path = []
+        if g[goal] < INF:
+            cur = goal
+            path.append(cur)
+            while cur != self.start:
+                cur = min(self._neighbors(cur), key=g.__getitem__)
+                path.append(cur)
+            path.reverse()
+        path = [maze.cell_at(i) for i in path]
+
+        self.solves += 1
+        runtime = time.perf_counter() - start_time
+
+        visited = None
+        if trace != "none":
+            visited = bytearray(len(g))
+            for i in explored_order:
+                visited[i] = 1
+        explored, explored_order = package_trace(maze, trace, visited, explored_order)
+
+        return {
+            "path": path,
+            "moves": max(0, len(path) - 1),
+            "nodes_expanded": nodes_expanded,
+            "runtime": runtime,
+            "memory": memory_usage,
+            "explored": explored,
+            "explored_order": explored_order,
+            "replan": self.solves > 1,
+        }
+
+
+def lpa_astar_solver(maze, heuristic, planner=None, trace="full"):
+    """
+    A* that can be re-run cheaply after wall edits. The result dict
+    carries the planner under "planner"; pass it back on the next call
+    (after telling it about the edits via planner.add_wall /
+    remove_wall / update_cells).
+    """
+    if planner is None:
+        planner = IncrementalAStar(maze, heuristic)
+    result = planner.solve(trace=trace)
+    result["planner"] = planner
+    return result
@@ -4,88 +4,219 @@ Description: MDP solver for Maze using Policy Iteration
 """
 
 import time
+from src.solvers.utils import initial_values
 
+# how each policy is evaluated:
+#   "iterative" sweeps V <- r + gamma * V[policy] until delta < 1e-4
+#   "exact"     solves the policy's functional graph in one O(n) pass
+#   "partial"   modified policy iteration: only `sweeps` sweeps per policy
+EVALUATIONS = ("iterative", "exact", "partial")
+
+# sweeps="adaptive": evaluate until delta drops below this fraction of
+# the last improvement's Bellman residual (at least one sweep)
+ADAPTIVE_FRACTION = 0.5
+
+# with exact evaluation the improvement step keeps the current action
+# unless another beats it by more than this: values that only differ by
+# rounding (e.g. cells leading into cycles of the policy, all close to
+# step_cost / (1 - gamma)) would otherwise swap actions forever
+IMPROVEMENT_TOLERANCE = 1e-9
+
+
+def evaluate_policy_exact(policy, V, goal, gamma, goal_reward, step_cost):
+    """
+    Exact V for a deterministic policy (policy[s] = successor id, -1 for
+    no action). Every state has one successor, so the policy is a
+    functional graph: each state leads either to a sink (the goal or a
+    state without an action, whose value stays as in V) or into a cycle.
+    A cycle c0 -> ... -> c(L-1) -> c0 is solved in closed form,
+        V[c0] = sum_j gamma^j r(c_j) / (1 - gamma^L),
+    and everything else by one backward pass along the walk that reached
+    it. Each state is visited a constant number of times.
+    Returns the new value list and the number of states evaluated.
+    """
+    n = len(policy)
+    V = list(V)
+    done = bytearray(n) # 0 = unseen, 1 = on the current walk, 2 = solved
+    evaluated = 0
+
+    def reward(state):
+        return goal_reward if policy[state] == goal else step_cost
+
+    for root in range(n):
+        if done[root]:
+            continue
+
+        # follow the policy until reaching a solved state, a sink or the walk itself
+        walk = []
+        state = root
+        while not done[state] and state != goal and policy[state] >= 0:
+            done[state] = 1
+            walk.append(state)
+            state = policy[state]
+
+        if done[state] == 1:
+            # closed a cycle: it starts where the walk first visited `state`
+            start = walk.index(state)
+            cycle = walk[start:]
+            del walk[start:]
+            length = len(cycle)
+            if gamma >= 1:
+                raise ValueError("Exact evaluation needs gamma < 1 when the policy has cycles.")
+
+            total = 0.0
+            discount = 1.0
+            for c in cycle:
+                total += discount * reward(c)
+                discount *= gamma
+            V[cycle[0]] = total / (1 - discount)
+            for c in reversed(cycle[1:]):
+                V[c] = reward(c) + gamma * V[policy[c]]
+            for c in cycle:
+                done[c] = 2
+            evaluated += length
+        else:
+            done[state] = 2 # sink or already solved: its value is final
+
+        # tree part: back along the walk, each state from its successor
+        for c in reversed(walk):
+            V[c] = reward(c) + gamma * V[policy[c]]
+            done[c] = 2
+        evaluated += len(walk)
+
+    return V, evaluated
+
+
+def policy_iteration(maze, gamma=0.9, goal_reward=100, step_cost=-1, evaluation="iterative", sweeps=5,
+                     init_values=None, init_policy=None):
+    """
+    evaluation: "iterative", "exact" or "partial" (see EVALUATIONS).
+    sweeps: for "partial", evaluation sweeps per improvement, or
+    "adaptive" to scale them with the Bellman residual (few while the
+    policy is still changing a lot, more as it settles). Partial
+    evaluation leaves V inexact, so it stops once the policy is stable
+    and the residual max |T V - V| is below 1e-4.
+    init_values / init_policy: warm start from an earlier solve's
+    "values" (cell -> value) and "policy" (cell -> next cell), e.g. one
+    with a nearby gamma, instead of zeros and the Manhattan-greedy
+    policy. Cells the given policy leaves without a move fall back to
+    the greedy choice.
+    """
+    if evaluation not in EVALUATIONS:
+        raise ValueError(f"Invalid evaluation: {evaluation} (expected one of {EVALUATIONS})")
+    if evaluation == "partial" and sweeps != "adaptive" and (not isinstance(sweeps, int) or sweeps < 1):
+        raise ValueError(f"Sweeps must be a positive integer or 'adaptive', got {sweeps}.")
 
-def policy_iteration(maze, gamma=0.9, goal_reward=100, step_cost=-1):
     # start timer
     start_time = time.time()
 
-    # initialise random policy
-    policy = {}
+    # states are flat cell ids over the maze's CSR adjacency;
+    # policy[s] is the successor id, or -1 for no action
+    n = maze.height * maze.width
+    width = maze.width
+    goal = maze.cell_id(maze.goal)
+    offsets, targets = maze.adjacency_lists()
+
+    # initialise policy (given, or greedy toward the goal)
+    policy = [-1] * n
     gr, gc = maze.goal  # cache goal once
 
-    for state in maze.all_cells():
-        if state == maze.goal:
-            policy[state] = None
+    for state in range(n):
+        if state == goal:
             continue
 
-        neighbors = maze.neighbors(state)
+        neighbors = targets[offsets[state]:offsets[state + 1]]
         if not neighbors:
-            policy[state] = None
+            continue
+
+        if init_policy is not None and init_policy.get(maze.cell_at(state)) is not None:
+            action = maze.cell_id(init_policy[maze.cell_at(state)])
+            if action not in neighbors:
+                raise ValueError(f"Initial policy moves {maze.cell_at(state)} through a wall.")
+            policy[state] = action
             continue
 
         # initialise policy pointing roughly toward goal
         policy[state] = min(
             neighbors,
-            key=lambda n: abs(n[0] - gr) + abs(n[1] - gc)
+            key=lambda nbr: abs(nbr // width - gr) + abs(nbr % width - gc)
         )
 
     # initialise value function
-    V = {}
-    for state in maze.all_cells():
-        V[state] = 0
+    V = initial_values(maze, init_values)
 
-    policy_stable = False
     policy_iterations = 0
     evaluation_iterations = 0
-    state_updates = 0
+    state_updates = 0 # evaluation backups
+    # how the work splits between the two phases
+    improvement_updates = 0
+    evaluation_runtime = 0.0
+    improvement_runtime = 0.0
+    residual = float("inf") # max |T V - V| at the last improvement
 
-    while not policy_stable:
+    while True:
 
         # Policy Evaluation
-        while True:
-            delta = 0
-            new_V = V.copy()
+        phase_start = time.time()
+        if evaluation == "exact":
+            V, evaluated = evaluate_policy_exact(policy, V, goal, gamma, goal_reward, step_cost)
+            state_updates += evaluated
+            evaluation_iterations += 1
+        else:
+            sweep = 0
+            while True:
+                delta = 0
+                new_V = V[:]
 
-            for state in maze.all_cells():
-                if state == maze.goal:
-                    continue
+                for state in range(n):
+                    if state == goal:
+                        continue
 
-                action = policy[state]
-                if action is None:
-                    continue
+                    action = policy[state]
+                    if action < 0:
+                        continue
 
-                reward = step_cost
-                if action == maze.goal:
-                    reward = goal_reward
-                value = reward + gamma * V[action]
+                    reward = step_cost
+                    if action == goal:
+                        reward = goal_reward
+                    value = reward + gamma * V[action]
 
-                new_V[state] = value
-                state_updates += 1
-                delta = max(delta, abs(new_V[state] - V[state]))
+                    new_V[state] = value
+                    state_updates += 1
+                    delta = max(delta, abs(new_V[state] - V[state]))
 
-            V = new_V
-            evaluation_iterations += 1
+                V = new_V
+                evaluation_iterations += 1
+                sweep += 1
 
-            if delta < 1e-4:
-                break
+                if delta < 1e-4:
+                    break
+                if evaluation == "partial":
+                    if sweeps == "adaptive":
+                        if delta < ADAPTIVE_FRACTION * residual:
+                            break
+                    elif sweep >= sweeps:
+                        break
+        evaluation_runtime += time.time() - phase_start
 
         # Policy Improvement
+        phase_start = time.time()
         policy_stable = True
+        residual = 0
 
-        for state in maze.all_cells():
-            if state == maze.goal:
+        for state in range(n):
+            if state == goal:
                 continue
 
             old_action = policy[state]
-            neighbors = maze.neighbors(state)
 
-            best_action = None
+            best_action = -1
             best_value = float("-inf")
 
-            for next_state in neighbors:
+            for k in range(offsets[state], offsets[state + 1]):
+                next_state = targets[k]
                 reward = step_cost
-                if next_state == maze.goal:
+                if next_state == goal:
                     reward = goal_reward
                 value = reward + gamma * V[next_state]
 
@@ -93,21 +224,39 @@ def policy_iteration(maze, gamma=0.9, goal_reward=100, step_cost=-1):
                     best_value = value
                     best_action = next_state
 
+            if evaluation == "exact" and best_action != old_action and old_action >= 0:
+                reward = goal_reward if old_action == goal else step_cost
+                if best_value - (reward + gamma * V[old_action]) <= IMPROVEMENT_TOLERANCE:
+                    best_action = old_action
+
             policy[state] = best_action
+            if best_action >= 0:
+                improvement_updates += 1
+                residual = max(residual, abs(best_value - V[state]))
 
             if best_action != old_action:
                 policy_stable = False
 
         policy_iterations += 1
+        improvement_runtime += time.time() - phase_start
+
+        if policy_stable and (evaluation != "partial" or residual < 1e-4):
+            break
 
     runtime = time.time() - start_time
 
     return {
-        "policy": policy,
-        "values": V,
+        "policy": {
+            maze.cell_at(state): None if policy[state] < 0 else maze.cell_at(policy[state])
+            for state in range(n)
+        },
+        "values": {maze.cell_at(state): V[state] for state in range(n)},
         "policy_iterations": policy_iterations,
         "evaluation_iterations": evaluation_iterations,
         "state_updates": state_updates,
+        "improvement_updates": improvement_updates,
+        "evaluation_runtime": evaluation_runtime,
+        "improvement_runtime": improvement_runtime,
         "runtime": runtime,
         "memory": len(V),
-    }
\ No newline at end of file
+    }
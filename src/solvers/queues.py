@@ -0,0 +1,176 @@
+"""
+Author: Priyansh Nayak
+Description: Open-list priority queues for A* over flat cell ids
+    lazy binary heap, bucket queue (Dial's algorithm), indexed heap
+"""
+
+import heapq
+from array import array
+
+
+class HeapQueue:
+    """
+    heapq with lazy deletion: a better route pushes a duplicate entry
+    and the stale one is skipped when popped. Equal f-values pop in
+    insertion order. Keys may be numbers or tuples such as (f, -g).
+    """
+
+    def __init__(self, n: int):
+        self.n = n
+        self.heap = []
+        self.tie_breaker = 0
+
+    def push(self, f, cell: int) -> None:
+        # (f, tie * n + cell): ordered by f then insertion, no 3-tuples
+        heapq.heappush(self.heap, (f, self.tie_breaker * self.n + cell))
+        self.tie_breaker += 1
+
+    def pop(self) -> int:
+        return heapq.heappop(self.heap)[1] % self.n
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+
+class BucketQueue:
+    """
+    Dial's bucket queue for integer f-values: one list per f, O(1) push,
+    decrease-key and pop. Holds each cell at most once, so there are no
+    stale entries. Cells within a bucket pop newest first.
+    """
+
+    def __init__(self, n: int):
+        self.buckets = []
+        self.bucket_of = array("i", [-1]) * n # -1 = not queued
+        self.pos = array("i", [0]) * n # index inside its bucket
+        self.cursor = 0 # no queued cell has f below this
+        self.size = 0
+
+    def push(self, f, cell: int) -> None:
+        b = int(f)
+        if b != f:
+            raise ValueError(f"BucketQueue needs integer f-values, got {f}.")
+
+        if self.bucket_of[cell] >= 0:
+            self._remove(cell)
+        else:
+            self.size += 1
+
+        while len(self.buckets) <= b:
+            self.buckets.append([])
+        bucket = self.buckets[b]
+        self.bucket_of[cell] = b
+        self.pos[cell] = len(bucket)
+        bucket.append(cell)
+        if b < self.cursor:
+            self.cursor = b
+
+    def pop(self) -> int:
+        buckets = self.buckets
+        while not buckets[self.cursor]:
+            self.cursor += 1
+        cell = buckets[self.cursor].pop()
+        self.bucket_of[cell] = -1
+        self.size -= 1
+        return cell
+
+    def _remove(self, cell: int) -> None:
+        # swap with the bucket's last cell, then drop the tail
+        bucket = self.buckets[self.bucket_of[cell]]
+        last = bucket.pop()
+        if last != cell:
+            i = self.pos[cell]
+            bucket[i] = last
+            self.pos[last] = i
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class IndexedHeap:
+    """
+    Binary min-heap of cells with a position index, so a better route
+    lowers the cell's key in place (decrease-key) instead of adding a
+    duplicate. Equal f-values pop in the order their key was last set.
+    Keys may be numbers or tuples such as (f, -g).
+    """
+
+    def __init__(self, n: int):
+        self.heap = []
+        self.pos = array("i", [-1]) * n # -1 = not queued
+        self.f = [0.0] * n
+        self.seq = array("q", [0]) * n
+        self.counter = 0
+
+    def _less(self, a: int, b: int) -> bool:
+        fa, fb = self.f[a], self.f[b]
+        return fa < fb or (fa == fb and self.seq[a] < self.seq[b])
+
+    def push(self, f, cell: int) -> None:
+        self.f[cell] = f
+        self.seq[cell] = self.counter
+        self.counter += 1
+
+        i = self.pos[cell]
+        if i < 0:
+            i = len(self.heap)
+            self.heap.append(cell)
+            self.pos[cell] = i
+            self._sift_up(i)
+        else:
+            # A* only ever lowers a queued cell's key
+            self._sift_up(i)
+
+    def pop(self) -> int:
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        self.pos[top] = -1
+        if heap:
+            heap[0] = last
+            self.pos[last] = 0
+            self._sift_down(0)
+        return top
+
+    def _sift_up(self, i: int) -> None:
+        heap, pos = self.heap, self.pos
+        cell = heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            other = heap[parent]
+            if not self._less(cell, other):
+                break
+            heap[i] = other
+            pos[other] = i
+            i = parent
+        heap[i] = cell
+        pos[cell] = i
+
+    def _sift_down(self, i: int) -> None:
+        heap, pos = self.heap, self.pos
+        size = len(heap)
+        cell = heap[i]
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            right = child + 1
+            if right < size and self._less(heap[right], heap[child]):
+                child = right
+            if not self._less(heap[child], cell):
+                break
+            heap[i] = heap[child]
+            pos[heap[i]] = i
+            i = child
+        heap[i] = cell
+        pos[cell] = i
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+
+OPEN_LISTS = {
+    "heap": HeapQueue,
+    "bucket": BucketQueue,
+    "indexed": IndexedHeap,
+}
@@ -0,0 +1,242 @@
+"""
+Author: Priyansh Nayak
+Description: Registry of the Maze solvers, with a uniform result type
+    used by the experiment runner, the samples and the Pygame demo
+"""
+
+from src.solvers.dfs import dfs_solver
+from src.solvers.bfs import bfs_solver
+from src.solvers.bidirectional_bfs import bidirectional_bfs_solver
+from src.solvers.astar import astar_solver, manhattan, euclidean
+from src.solvers.landmarks import maze_landmarks
+from src.solvers.ida_star import ida_star_solver
+from src.solvers.sma_star import sma_star_solver
+from src.solvers.ara_star import ara_star_solver
+from src.solvers.distance_field import distance_field_solver
+from src.solvers.hpa import hpa_solver
+from src.solvers.contracted import astar_contracted, value_iteration_contracted
+from src.solvers.value_iter import value_iteration
+from src.solvers.policy_iter import policy_iteration
+from src.solvers.utils import extract_path
+
+SEARCH, MDP = "search", "mdp"
+
+
+class SolverResult:
+    """
+    One solver run, with the same fields whatever the solver:
+
+    path, moves        start-to-goal cells (MDPs: following the policy)
+    runtime, memory    as reported by the solver
+    work               nodes expanded (search) or state updates (MDP)
+    iterations         solver rounds (VI sweeps, PI improvements, ...) or None
+    explored, explored_order   search trace (None for MDPs or trace="none")
+    policy, values     MDP output (None for search)
+    extra              every other metric, under the solver's own key
+    """
+
+    __slots__ = (
+        "path", "moves", "runtime", "work", "memory", "iterations",
+        "explored", "explored_order", "policy", "values", "extra",
+    )
+
+    def __init__(self, path, moves, runtime, work, memory, iterations=None,
+                 explored=None, explored_order=None, policy=None, values=None, extra=None):
+        self.path = path
+        self.moves = moves
+        self.runtime = runtime
+        self.work = work
+        self.memory = memory
+        self.iterations = iterations
+        self.explored = explored
+        self.explored_order = explored_order
+        self.policy = policy
+        self.values = values
+        self.extra = extra if extra is not None else {}
+
+    def metric(self, name):
+        """A field by name, falling back to the solver-specific extras."""
+        if name in self.__slots__:
+            return getattr(self, name)
+        return self.extra[name]
+
+    def __repr__(self) -> str:
+        return (f"SolverResult(moves={self.moves}, work={self.work}, memory={self.memory}, "
+                f"iterations={self.iterations}, runtime={self.runtime:.6f})")
+
+
+class SolverSpec:
+    """
+    A registered solver.
+
+    func(maze, **fixed, **params) returns the solver's raw result dict.
+    params maps every parameter callers may set to its default;
+    fixed holds arguments bound at registration (e.g. the heuristic).
+    label: name in the Pygame demo (None = not listed).
+    title: sample render title (None = no sample).
+    experiment: run by default in runner.run_experiments.
+    columns: extra metrics written to the experiment CSVs.
+    """
+
+    __slots__ = ("name", "kind", "func", "params", "fixed", "label", "title",
+                 "experiment", "columns", "work_key", "iterations_key")
+
+    def __init__(self, name, kind, func, params, fixed, label, title,
+                 experiment, columns, work_key, iterations_key):
+        self.name = name
+        self.kind = kind
+        self.func = func
+        self.params = params
+        self.fixed = fixed
+        self.label = label
+        self.title = title
+        self.experiment = experiment
+        self.columns = columns
+        self.work_key = work_key
+        self.iterations_key = iterations_key
+
+    def select(self, params: dict) -> dict:
+        """The subset of `params` this solver accepts."""
+        return {k: v for k, v in params.items() if k in self.params}
+
+    def run(self, maze, **params) -> SolverResult:
+        unknown = set(params) - set(self.params)
+        if unknown:
+            raise ValueError(f"{self.name} got unknown parameters: {sorted(unknown)}")
+
+        raw = dict(self.func(maze, **self.fixed, **{**self.params, **params}))
+
+        path = raw.pop("path", None)
+        moves = raw.pop("moves", None)
+        policy = raw.pop("policy", None)
+        if path is None:
+            # MDPs: the path is the policy followed from the start
+            path = extract_path(policy, maze.start, maze.goal)
+            moves = max(0, len(path) - 1)
+
+        return SolverResult(
+            path=path,
+            moves=moves,
+            runtime=raw.pop("runtime"),
+            work=raw.pop(self.work_key),
+            memory=raw.pop("memory"),
+            iterations=raw.get(self.iterations_key),
+            explored=raw.pop("explored", None),
+            explored_order=raw.pop("explored_order", None),
+            policy=policy,
+            values=raw.pop("values", None),
+            extra=raw,
+        )
+
+
+SOLVERS = {} # name -> SolverSpec, in registration order
+
+SEARCH_PARAMS = {"trace": "full"}
+MDP_PARAMS = {"gamma": 0.9, "goal_reward": 100, "step_cost": -1}
+
+
+def register(name, func, kind=SEARCH, params=None, fixed=None, label=None, title=None,
+             experiment=False, columns=(), iterations_key="iterations") -> SolverSpec:
+    """
+    Add a solver under `name` (also its "algorithm" value in the CSVs).
+    params defaults to the kind's usual parameters: trace for search,
+    gamma / goal_reward / step_cost for MDPs.
+    """
+    if kind not in (SEARCH, MDP):
+        raise ValueError(f"Invalid solver kind: {kind}")
+    if name in SOLVERS:
+        raise ValueError(f"Solver already registered: {name}")
+
+    if params is None:
+        params = SEARCH_PARAMS if kind == SEARCH else MDP_PARAMS
+    spec = SolverSpec(
+        name=name,
+        kind=kind,
+        func=func,
+        params=dict(params),
+        fixed=dict(fixed or {}),
+        label=label,
+        title=title,
+        experiment=experiment,
+        columns=tuple(columns),
+        work_key="nodes_expanded" if kind == SEARCH else "state_updates",
+        iterations_key=iterations_key,
+    )
+    SOLVERS[name] = spec
+    return spec
+
+
+def get_solver(name) -> SolverSpec:
+    try:
+        return SOLVERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown solver: {name}") from None
+
+
+def solver_by_label(label) -> SolverSpec:
+    for spec in SOLVERS.values():
+        if spec.label == label:
+            return spec
+    raise ValueError(f"Unknown algorithm: {label}")
+
+
+def run_solver(name, maze, **params) -> SolverResult:
+    return get_solver(name).run(maze, **params)
+
+
+def _astar_alt(maze, **kwargs):
+    # landmarks are cached on the maze, so only the first run pays for them
+    return astar_solver(maze, maze_landmarks(maze), **kwargs)
+
+
+# -------------------------
+# Built-in solvers
+# -------------------------
+
+ASTAR_PARAMS = {"trace": "full", "open_list": "heap", "weight": 1.0, "tie_break": "fifo"}
+
+register("DFS", dfs_solver, label="DFS", title="DFS Solution", experiment=True)
+register("BFS", bfs_solver, label="BFS", title="BFS Solution", experiment=True)
+register("Bidirectional_BFS", bidirectional_bfs_solver,
+         label="Bidirectional BFS", title="Bidirectional BFS Solution", experiment=True)
+register("A*_Manhattan", astar_solver, params=ASTAR_PARAMS, fixed={"heuristic": manhattan},
+         label="A* Manhattan", title="Astar Manhattan", experiment=True)
+register("A*_Euclidean", astar_solver, params=ASTAR_PARAMS, fixed={"heuristic": euclidean},
+         label="A* Euclidean", title="Astar Euclidean", experiment=True)
+register("A*_ALT", _astar_alt, params=ASTAR_PARAMS, label="A* ALT Landmarks")
+register("A*_Contracted", astar_contracted, fixed={"heuristic": manhattan}, label="A* Contracted")
+# not in the Pygame menu: on the demo's maze sizes they can run for
+# seconds before finishing or giving up, which freezes the window
+register("IDA*", ida_star_solver, params={"trace": "full", "max_expansions": 1_000_000},
+         fixed={"heuristic": manhattan})
+register("SMA*", sma_star_solver, params={"trace": "full", "max_nodes": 10_000, "max_expansions": 1_000_000},
+         fixed={"heuristic": manhattan})
+register("ARA*", ara_star_solver, params={"trace": "full", "time_budget": None, "tie_break": "deep"},
+         fixed={"heuristic": manhattan}, label="ARA*")
+register("Distance_Field", distance_field_solver, label="Distance Field")
+register("HPA*", hpa_solver, params={"trace": "full", "cluster_size": 16}, label="HPA*")
+
+# only policy iteration takes init_values / init_policy here, so the experiment
+# runner warm-starts just the PI variants: value iteration gains little from
+# an earlier solution (and the in-place orders lose their pessimistic start)
+PI_PARAMS = {**MDP_PARAMS, "init_values": None, "init_policy": None}
+
+register("Value_Iteration", value_iteration, kind=MDP, params={**MDP_PARAMS, "backend": "numpy"},
+         label="MDP: Value Iteration",
+         title="Value Iteration Policy", experiment=True, columns=("iterations", "delta"))
+register("Value_Iteration_Goal_Ordered", value_iteration, kind=MDP, fixed={"order": "goal"},
+         label="MDP: Value Iteration (Goal-Ordered)", columns=("iterations", "delta"))
+register("Value_Iteration_Prioritized", value_iteration, kind=MDP, fixed={"order": "priority"},
+         label="MDP: Value Iteration (Prioritized)", columns=("iterations", "delta"))
+register("Value_Iteration_Contracted", value_iteration_contracted, kind=MDP,
+         label="MDP: Value Iteration (Contracted)")
+register("Policy_Iteration", policy_iteration, kind=MDP, params=PI_PARAMS, label="MDP: Policy Iteration",
+         title="Policy Iteration Policy", experiment=True,
+         columns=("policy_iterations", "evaluation_iterations"), iterations_key="policy_iterations")
+register("Policy_Iteration_Exact", policy_iteration, kind=MDP, params=PI_PARAMS, fixed={"evaluation": "exact"},
+         label="MDP: Policy Iteration (Exact Eval)",
+         columns=("policy_iterations", "evaluation_iterations"), iterations_key="policy_iterations")
+register("Modified_Policy_Iteration", policy_iteration, kind=MDP, params={**PI_PARAMS, "sweeps": 5},
+         fixed={"evaluation": "partial"}, label="MDP: Modified Policy Iteration",
+         columns=("policy_iterations", "evaluation_iterations", "improvement_updates"),
+         iterations_key="policy_iterations")
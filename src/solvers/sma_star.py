@@ -0,0 +1,226 @@
+"""
+Author: Priyansh Nayak
+Description: SMA* (simplified memory-bounded A*) solver for the Maze
+    A* over a search tree that never holds more than max_nodes nodes
+"""
+
+import time
+import heapq
+from array import array
+from src.solvers.astar import heuristic_table
+from src.solvers.utils import check_trace, package_trace
+
+INF = float("inf")
+
+
+def sma_star_solver(maze, heuristic, max_nodes=10_000, max_expansions=None, trace="full"):
+    """
+    Best-first search like A*, but over search-tree nodes with a hard
+    cap of max_nodes held at once. When the cap is exceeded the worst
+    leaf (highest f, shallowest) is dropped and its f is remembered by
+    its parent, which becomes a candidate again at that f: choosing it
+    regenerates the forgotten child. Optimal whenever max_nodes can
+    hold the optimal path; nodes at the deepest level the budget allows
+    get f = inf, so with too small a budget it returns no path.
+
+    Graph version: a successor is not generated while a node for the
+    same cell is in memory with g no larger, since the path through that
+    node is at least as good. This also rules out cycles, and keeps the
+    budget spent on distinct cells.
+
+    The lazy heaps are rebuilt from the live nodes whenever stale entries
+    outnumber them two to one, so memory stays O(max_nodes).
+    max_expansions: give up (empty path, "aborted": True) after this many
+    expansions, since a tight budget can make SMA* regenerate the same
+    nodes for a very long time.
+    trace: "none", "compact" or "full" (see src.solvers.utils.TRACE_LEVELS)
+    """
+    check_trace(trace)
+    if max_nodes < 2:
+        raise ValueError("SMA* needs a budget of at least two nodes.")
+
+    start_time = time.perf_counter()
+    n = maze.height * maze.width
+    start = maze.cell_id(maze.start)
+    goal = maze.cell_id(maze.goal)
+    offsets, targets = maze.adjacency_lists()
+    h = heuristic_table(maze, heuristic)
+
+    # tree nodes, keyed by a running id
+    cell_of = {} # node -> cell
+    g_of = {} # node -> cost from start
+    f_of = {} # node -> backed-up f (never decreases)
+    parent_of = {} # node -> parent node (None for the root)
+    kids = {} # node -> number of children in memory
+    forgotten = {} # node -> {child cell: f of the dropped child}
+    fresh = set() # nodes not expanded yet
+    open_f = {} # candidate node -> f it would be expanded at
+    at_cell = {} # cell -> {node in memory: its g}
+
+    # lazy heaps, checked against open_f / f_of when popped:
+    # best = candidates by lowest f then deepest,
+    # worst = leaves by highest f then shallowest
+    best, worst = [], []
+    next_id = 0
+
+    def set_open(node, f):
+        open_f[node] = f
+        heapq.heappush(best, (f, -g_of[node], node))
+
+    def add_leaf(node):
+        heapq.heappush(worst, (-f_of[node], g_of[node], -node))
+
+    def new_node(cell, g, f, parent):
+        nonlocal next_id
+        node = next_id
+        next_id += 1
+        cell_of[node] = cell
+        g_of[node] = g
+        f_of[node] = f
+        parent_of[node] = parent
+        kids[node] = 0
+        forgotten[node] = {}
+        fresh.add(node)
+        at_cell.setdefault(cell, {})[node] = g
+        set_open(node, f)
+        add_leaf(node)
+        if parent is not None:
+            kids[parent] += 1
+
+    def dominated(cell, g):
+        # some node in memory already reaches `cell` at cost <= g
+        held = at_cell.get(cell)
+        return held is not None and min(held.values()) <= g
+
+    # metrics
+    nodes_expanded = 0
+    re_expansions = 0 # expansions of cells already expanded earlier in the run
+    dropped = 0 # nodes forgotten to stay within the budget
+    memory_usage = 1
+    aborted = False
+    expanded = bytearray(n) # one byte per cell, for the metrics and trace only
+    explored_order = array("i") if trace != "none" else None
+
+    new_node(start, 0, h[start], None)
+    found = None
+
+    while best:
+        f, _, node = heapq.heappop(best)
+        if open_f.get(node) != f:
+            continue
+        if f == INF:
+            break # every candidate is a dead end or beyond the budget's depth
+        if max_expansions is not None and nodes_expanded >= max_expansions:
+            aborted = True
+            break
+        cell = cell_of[node]
+        g = g_of[node] + 1 # each move costs 1
+        memo = forgotten[node]
+
+        if node in fresh:
+            if cell == goal:
+                found = node
+                break
+            fresh.discard(node)
+            del open_f[node]
+            nodes_expanded += 1
+            if expanded[cell]:
+                re_expansions += 1
+            expanded[cell] = 1
+            if explored_order is not None:
+                explored_order.append(cell)
+
+            for k in range(offsets[cell], offsets[cell + 1]):
+                nbr = targets[k]
+                if dominated(nbr, g):
+                    continue
+                if nbr != goal and g >= max_nodes - 1:
+                    child_f = INF # the budget cannot hold a longer path
+                else:
+                    child_f = max(f, g + h[nbr]) # pathmax keeps f monotone along a branch
+                new_node(nbr, g, child_f, node)
+
+            if kids[node] == 0:
+                # dead end: keep it as an inf leaf so it is dropped first
+                f_of[node] = INF
+                add_leaf(node)
+        else:
+            # regenerate the best forgotten children, with the f they had,
+            # unless another node has reached their cell as cheaply since
+            for nbr, child_f in list(memo.items()):
+                if child_f == f:
+                    del memo[nbr]
+                    if not dominated(nbr, g):
+                        new_node(nbr, g, child_f, node)
+            if memo:
+                set_open(node, min(memo.values()))
+            else:
+                del open_f[node]
+            if kids[node] == 0:
+                # nothing regenerated: still a leaf, now at its next best f
+                f_of[node] = max(f_of[node], open_f.get(node, INF))
+                add_leaf(node)
+
+        # drop the worst leaves until back under budget
+        while len(f_of) > max_nodes:
+            neg_f, _, neg_leaf = heapq.heappop(worst)
+            leaf = -neg_leaf
+            if f_of.get(leaf) != -neg_f or kids[leaf] or parent_of[leaf] is None:
+                continue
+            p = parent_of[leaf]
+            memo = forgotten[p]
+            leaf_cell = cell_of[leaf]
+            memo[leaf_cell] = min(memo.get(leaf_cell, INF), f_of[leaf])
+            held = at_cell[leaf_cell]
+            del held[leaf]
+            if not held:
+                del at_cell[leaf_cell]
+            for table in (cell_of, g_of, f_of, parent_of, kids, forgotten):
+                del table[leaf]
+            fresh.discard(leaf)
+            open_f.pop(leaf, None)
+            dropped += 1
+            kids[p] -= 1
+            # the parent can regenerate what it forgot
+            set_open(p, min(memo.values()))
+            if kids[p] == 0:
+                # leaf again: f is the best child it has forgotten
+                f_of[p] = max(f_of[p], open_f[p])
+                add_leaf(p)
+
+        memory_usage = max(memory_usage, len(f_of))
+
+        # drop stale heap entries once they outnumber the live ones two to one
+        if len(best) > 2 * len(open_f) + 64:
+            best[:] = [(f, -g_of[node], node) for node, f in open_f.items()]
+            heapq.heapify(best)
+        if len(worst) > 2 * len(f_of) + 64:
+            worst[:] = [(-f_of[node], g_of[node], -node) for node in f_of if not kids[node]]
+            heapq.heapify(worst)
+
+    # reconstruct path
+    path = []
+    if found is not None:
+        node = found
+        while node is not None:
+            path.append(cell_of[node])
+            node = parent_of[node]
+        path.reverse()
+    path = [maze.cell_at(i) for i in path]
+
+    runtime = time.perf_counter() - start_time
+
+    explored, explored_order = package_trace(maze, trace, expanded, explored_order)
+
+    return {
+        "path": path,
+        "moves": max(0, len(path) - 1),
+        "nodes_expanded": nodes_expanded,
+        "re_expansions": re_expansions,
+        "dropped": dropped,
+        "runtime": runtime,
+        "memory": memory_usage,
+        "aborted": aborted,
+        "explored": explored,
+        "explored_order": explored_order
+    }
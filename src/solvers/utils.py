@@ -1,7 +1,36 @@
 """
 Author: Priyansh Nayak
-Description: Path extracter for maze using best policy 
+Description: Path extracter for maze using best policy,
+    trace packaging shared by the search solvers
+    and warm-start values shared by the MDP solvers
 """
+import numpy as np
+
+# how much of the exploration a search solver records:
+#   "none"    nothing (explored / explored_order are None)
+#   "compact" bytearray visited mask + array('i') of flat ids in expansion order
+#   "full"    set of (row, col) cells + list of cells in expansion order
+TRACE_LEVELS = ("none", "compact", "full")
+
+
+def check_trace(trace):
+    if trace not in TRACE_LEVELS:
+        raise ValueError(f"Invalid trace level: {trace} (expected one of {TRACE_LEVELS})")
+
+
+def package_trace(maze, trace, visited, order):
+    """
+    Turn a solver's visited mask and expansion order (flat ids)
+    into the (explored, explored_order) pair for `trace`.
+    """
+    if trace == "none":
+        return None, None
+    if trace == "compact":
+        return visited, order
+    explored = {maze.cell_at(i) for i in np.flatnonzero(np.frombuffer(visited, dtype=np.uint8)).tolist()}
+    return explored, [maze.cell_at(i) for i in order]
+
+
 def extract_path(policy, start, goal):
     # follow policy from start to goal
     path = []
@@ -19,4 +48,22 @@ def extract_path(policy, start, goal):
         if current in path:
             break
 
-    return path
\ No newline at end of file
+    return path
+
+def initial_values(maze, values=None):
+    """
+    Flat starting value list for an MDP solver: zeros, or `values`
+    (cell -> value, e.g. a previous solve's "values") to warm-start.
+    The goal and cells without moves are never updated, so they stay 0.
+    """
+    n = maze.height * maze.width
+    V = [0] * n
+    if values is None:
+        return V
+
+    goal = maze.cell_id(maze.goal)
+    offsets, _ = maze.adjacency_lists()
+    for state in range(n):
+        if state != goal and offsets[state] < offsets[state + 1]:
+            V[state] = float(values.get(maze.cell_at(state), 0))
+    return V
@@ -4,44 +4,80 @@ Description: MDP solver for Maze using Value Iteration
 """
 
 import time
+import heapq
+import numpy as np
+from src.solvers.distance_field import goal_distance_field
+from src.solvers.utils import initial_values
 
+# "numpy": whole-array Bellman sweeps (default)
+# "python": the original per-state loops, kept as a reference
+BACKENDS = ("numpy", "python")
+
+# update order:
+#   "sync"     Jacobi sweeps: every state from the previous sweep's values
+#   "goal"     Gauss-Seidel in place, states by BFS distance from the goal
+#   "priority" prioritized sweeping: largest Bellman error first, in place
+ORDERS = ("sync", "goal", "priority")
+
+
+def value_iteration(maze, gamma=0.9, goal_reward=100, step_cost=-1, backend="numpy", order="sync",
+                    init_values=None):
+    """
+    init_values: starting values (cell -> value), e.g. the "values" of a
+    solve with a nearby gamma, instead of zeros. Convergence does not
+    depend on the start, only the number of sweeps does.
+    backend applies to "sync" sweeps only; the in-place orders update
+    one state at a time and always run in Python. For "priority",
+    iterations counts sweep equivalents (updates / updatable states).
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Invalid backend: {backend} (expected one of {BACKENDS})")
+    if order not in ORDERS:
+        raise ValueError(f"Invalid order: {order} (expected one of {ORDERS})")
+    if order != "sync":
+        return _value_iteration_in_place(maze, gamma, goal_reward, step_cost, order, init_values)
+    if backend == "numpy":
+        return _value_iteration_numpy(maze, gamma, goal_reward, step_cost, init_values)
 
-def value_iteration(maze, gamma=0.9, goal_reward=100, step_cost=-1):
     # start timer
     start_time = time.time()
 
-    # initialise value function (V(s) = 0 for all states)
-    V = {}
-    for state in maze.all_cells():
-        V[state] = 0
+    # states are flat cell ids over the maze's CSR adjacency
+    n = maze.height * maze.width
+    goal = maze.cell_id(maze.goal)
+    offsets, targets = maze.adjacency_lists()
+
+    # initialise value function (V(s) = 0 for all states, unless warm-started)
+    V = initial_values(maze, init_values)
 
     # metrics
     iterations = 0
     state_updates = 0
-    final_delta = 0
+    final_delta = 0.0
 
     # repeat until values converge
     while True:
         delta = 0
-        new_V = V.copy()
+        new_V = V[:]
 
-        for state in maze.all_cells():
+        for state in range(n):
             # skip goal (terminal state)
-            if state == maze.goal:
+            if state == goal:
                 continue
 
-            neighbors = maze.neighbors(state)
+            lo, hi = offsets[state], offsets[state + 1]
 
             # if no available moves, skip
-            if not neighbors:
+            if lo == hi:
                 continue
 
             best_value = float("-inf")
 
-            # Bellman update    
-            for next_state in neighbors:
+            # Bellman update
+            for k in range(lo, hi):
+                next_state = targets[k]
                 reward = step_cost
-                if next_state == maze.goal:
+                if next_state == goal:
                     reward = goal_reward
                 value = reward + gamma * V[next_state]
 
@@ -51,7 +87,7 @@ def value_iteration(maze, gamma=0.9, goal_reward=100, step_cost=-1):
             new_V[state] = best_value
             state_updates += 1
             delta = max(delta, abs(new_V[state] - V[state]))
-        
+
         # update metrics
         V = new_V
         iterations += 1
@@ -64,19 +100,19 @@ def value_iteration(maze, gamma=0.9, goal_reward=100, step_cost=-1):
     # extract optimal policy from final values
     policy = {}
 
-    for state in maze.all_cells():
-        if state == maze.goal:
-            policy[state] = None
+    for state in range(n):
+        cell = maze.cell_at(state)
+        if state == goal:
+            policy[cell] = None
             continue
 
-        neighbors = maze.neighbors(state)
-
         best_action = None
         best_value = float("-inf")
 
-        for next_state in neighbors:
+        for k in range(offsets[state], offsets[state + 1]):
+            next_state = targets[k]
             reward = step_cost
-            if next_state == maze.goal:
+            if next_state == goal:
                 reward = goal_reward
             value = reward + gamma * V[next_state]
 
@@ -84,16 +120,218 @@ def value_iteration(maze, gamma=0.9, goal_reward=100, step_cost=-1):
                 best_value = value
                 best_action = next_state
 
-        policy[state] = best_action
+        policy[cell] = None if best_action is None else maze.cell_at(best_action)
+
+    runtime = time.time() - start_time
+
+    return {
+        "policy": policy,
+        "values": {maze.cell_at(state): V[state] for state in range(n)},
+        "iterations": iterations,
+        "state_updates": state_updates,
+        "runtime": runtime,
+        "memory": len(V),
+        "delta": final_delta,
+    }
+
+
+def padded_neighbors(maze):
+    """
+    (k, n) table of neighbour ids, k = the largest degree: row j holds
+    each cell's j-th neighbour in the CSR's N, E, S, W order, plus a
+    mask of the valid entries. Padding entries point at the cell itself.
+    """
+    n = maze.height * maze.width
+    offsets, targets = maze.adjacency()
+    degree = np.diff(offsets)
+    k = max(1, int(degree.max(initial=0)))
+
+    cells = np.repeat(np.arange(n), degree)
+    slots = np.arange(len(targets)) - offsets[cells]
+    table = np.repeat(np.arange(n)[None, :], k, axis=0)
+    table[slots, cells] = targets
+    mask = np.zeros((k, n), dtype=bool)
+    mask[slots, cells] = True
+    return table, mask
+
+
+def _value_iteration_numpy(maze, gamma, goal_reward, step_cost, init_values):
+    # same sweeps, values and policy as the python backend: one gather
+    # and running max per neighbour slot instead of per-state loops
+    start_time = time.time()
+
+    n = maze.height * maze.width
+    goal = maze.cell_id(maze.goal)
+    nbr, mask = padded_neighbors(maze)
+
+    # reward of each move, -inf on padding so it never wins the max
+    reward = np.where(nbr == goal, float(goal_reward), float(step_cost))
+    reward[~mask] = -np.inf
+    # states that get a Bellman update: not the goal, at least one move
+    active = mask.any(axis=0)
+    active[goal] = False
+    updates_per_sweep = int(active.sum())
+
+    V = np.array(initial_values(maze, init_values), dtype=float)
+    best_value = np.empty(n)
+    q = np.empty(n)
+
+    # metrics
+    iterations = 0
+    state_updates = 0
+    final_delta = 0.0
+
+    while True:
+        # max over moves of r(s, a) + gamma * V[next(s, a)]
+        best_value.fill(-np.inf)
+        for j in range(len(nbr)):
+            np.take(V, nbr[j], out=q)
+            q *= gamma
+            q += reward[j]
+            np.maximum(best_value, q, out=best_value)
+        new_V = np.where(active, best_value, V)
+
+        delta = float(np.abs(new_V - V).max(initial=0))
+        V = new_V
+        iterations += 1
+        state_updates += updates_per_sweep
+        final_delta = delta
+
+        if delta < 1e-4:
+            break
+
+    # greedy policy: first best move in N, E, S, W order
+    Q = reward + gamma * V[nbr]
+    best = nbr[Q.argmax(axis=0), np.arange(n)]
+    best = np.where(active, best, -1)
+
+    cells = [maze.cell_at(state) for state in range(n)]
+    policy = {cells[s]: None if a < 0 else cells[a] for s, a in enumerate(best.tolist())}
+    values = dict(zip(cells, V.tolist()))
+
+    runtime = time.time() - start_time
+
+    return {
+        "policy": policy,
+        "values": values,
+        "iterations": iterations,
+        "state_updates": state_updates,
+        "runtime": runtime,
+        "memory": len(V),
+        "delta": final_delta,
+    }
+
+
+def _value_iteration_in_place(maze, gamma, goal_reward, step_cost, order, init_values):
+    # asynchronous updates: each backup reads the newest values, so
+    # information from the goal travels many cells per sweep
+    start_time = time.time()
+
+    n = maze.height * maze.width
+    goal = maze.cell_id(maze.goal)
+    offsets, targets = maze.adjacency_lists()
+
+    def backup(state):
+        best_value = float("-inf")
+        for k in range(offsets[state], offsets[state + 1]):
+            next_state = targets[k]
+            reward = goal_reward if next_state == goal else step_cost
+            value = reward + gamma * V[next_state]
+            if value > best_value:
+                best_value = value
+        return best_value
+
+    # states that get a Bellman update: not the goal, at least one move
+    active = [s for s in range(n) if s != goal and offsets[s] < offsets[s + 1]]
+    V = initial_values(maze, init_values)
+    if init_values is None and gamma < 1:
+        # start from below: no state can be worth less than collecting the
+        # worst reward forever. From zeros, which overestimate every cell
+        # far from the goal, each backup would prefer a stale neighbour and
+        # values would only shrink geometrically, as in Jacobi sweeps; from
+        # below, one goal-ordered pass already propagates the exact values.
+        floor = min(step_cost, goal_reward, 0) / (1 - gamma)
+        for state in active:
+            V[state] = floor
+
+    # metrics
+    iterations = 0
+    state_updates = 0
+    final_delta = 0.0
+
+    if order == "goal":
+        # nearest to the goal first; cells that cannot reach it go last
+        dist = goal_distance_field(maze).dist
+        active.sort(key=lambda s: dist[s] if dist[s] >= 0 else n)
+
+        while True:
+            delta = 0.0
+            for state in active:
+                value = backup(state)
+                delta = max(delta, abs(value - V[state]))
+                V[state] = value
+            state_updates += len(active)
+            iterations += 1
+            final_delta = delta
+
+            if delta < 1e-4:
+                break
+    else:
+        # max-heap on Bellman error; an entry is live while it matches error[s]
+        error = [0.0] * n
+        queue = []
+        for state in active:
+            error[state] = abs(backup(state) - V[state])
+            if error[state] >= 1e-4:
+                queue.append((-error[state], state))
+        heapq.heapify(queue)
+
+        while queue:
+            neg_error, state = heapq.heappop(queue)
+            if -neg_error != error[state]:
+                continue
+            V[state] = backup(state)
+            error[state] = 0.0
+            state_updates += 1
+
+            # a change at `state` only affects the backups of its neighbours
+            for k in range(offsets[state], offsets[state + 1]):
+                pred = targets[k]
+                if pred == goal:
+                    continue
+                err = abs(backup(pred) - V[pred])
+                if err != error[pred]:
+                    error[pred] = err
+                    if err >= 1e-4:
+                        heapq.heappush(queue, (-err, pred))
+
+        iterations = -(-state_updates // len(active)) if active else 0
+        final_delta = max((abs(backup(s) - V[s]) for s in active), default=0.0)
+
+    # extract greedy policy: first best move in N, E, S, W order
+    policy = {}
+    for state in range(n):
+        cell = maze.cell_at(state)
+        best_action = None
+        if state != goal:
+            best_value = float("-inf")
+            for k in range(offsets[state], offsets[state + 1]):
+                next_state = targets[k]
+                reward = goal_reward if next_state == goal else step_cost
+                value = reward + gamma * V[next_state]
+                if value > best_value:
+                    best_value = value
+                    best_action = next_state
+        policy[cell] = None if best_action is None else maze.cell_at(best_action)
 
     runtime = time.time() - start_time
 
     return {
         "policy": policy,
-        "values": V,
+        "values": {maze.cell_at(state): V[state] for state in range(n)},
         "iterations": iterations,
         "state_updates": state_updates,
         "runtime": runtime,
         "memory": len(V),
         "delta": final_delta,
-    }
\ No newline at end of file
+    }
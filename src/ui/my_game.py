@@ -7,51 +7,16 @@ import pygame
 import pygame_gui
 
 from src.maze.generator import generate_maze
-from src.solvers.dfs import dfs_solver
-from src.solvers.bfs import bfs_solver
-from src.solvers.astar import astar_solver, manhattan, euclidean
-from src.solvers.value_iter import value_iteration
-from src.solvers.policy_iter import policy_iteration
-from src.solvers.utils import extract_path
-
-ALGOS = [
-    "DFS",
-    "BFS",
-    "A* Manhattan",
-    "A* Euclidean",
-    "MDP: Value Iteration",
-    "MDP: Policy Iteration",
-]
+from src.solvers.registry import SOLVERS, MDP, solver_by_label
 
-def run_solver(maze, algo, gamma=0.9, goal_reward=100, step_cost=-1):
-    # returns: path (list), explored_order (list), metrics (dict)
-    if algo == "DFS":
-        res = dfs_solver(maze)
-        return res["path"], res.get("explored_order", []), res
-
-    if algo == "BFS":
-        res = bfs_solver(maze)
-        return res["path"], res.get("explored_order", []), res
-
-    if algo == "A* Manhattan":
-        res = astar_solver(maze, heuristic=manhattan)
-        return res["path"], res.get("explored_order", []), res
-
-    if algo == "A* Euclidean":
-        res = astar_solver(maze, heuristic=euclidean)
-        return res["path"], res.get("explored_order", []), res
-
-    if algo == "MDP: Value Iteration":
-        res = value_iteration(maze, gamma=gamma, goal_reward=goal_reward, step_cost=step_cost)
-        path = extract_path(res["policy"], maze.start, maze.goal)
-        return path, [], res
+# every registered solver with a demo label, in registration order
+ALGOS = [spec.label for spec in SOLVERS.values() if spec.label is not None]
 
-    if algo == "MDP: Policy Iteration":
-        res = policy_iteration(maze, gamma=gamma, goal_reward=goal_reward, step_cost=step_cost)
-        path = extract_path(res["policy"], maze.start, maze.goal)
-        return path, [], res
-
-    raise ValueError(f"Unknown algorithm: {algo}")
+def run_solver(maze, algo, gamma=0.9, goal_reward=100, step_cost=-1):
+    # returns: path (list), explored_order (list), result (SolverResult)
+    spec = solver_by_label(algo)
+    res = spec.run(maze, **spec.select({"gamma": gamma, "goal_reward": goal_reward, "step_cost": step_cost}))
+    return res.path, res.explored_order or [], res
 
 
 def draw_maze(screen, maze, canvas_rect,
@@ -261,7 +226,7 @@ def run_game():
         "maze": None,
         "path": [],
         "explored_order": [],
-        "metrics": {},
+        "metrics": None,
 
         "explored_set": set(),
         "path_set": set(),
@@ -496,7 +461,7 @@ def run_game():
 
         state["path"] = []
         state["explored_order"] = []
-        state["metrics"] = {}
+        state["metrics"] = None
         state["policy"] = None
         state["policy_order"] = []
         reset_animation()
@@ -516,7 +481,7 @@ def run_game():
         state["path"] = path
         state["explored_order"] = explored
         state["metrics"] = metrics
-        state["policy"] = metrics.get("policy", None)
+        state["policy"] = metrics.policy
 
         # simple reveal order for policy animation
         if state["policy"]:
@@ -535,26 +500,21 @@ def run_game():
             f"<b>Moves:</b> {moves}",
         ]
 
-        if "runtime" in state["metrics"]:
-            lines.append(f"<b>Runtime:</b> {state['metrics']['runtime']:.6f}s")
-
-        if "nodes_expanded" in state["metrics"]:
-            lines.append(f"<b>Nodes Expanded:</b> {state['metrics']['nodes_expanded']}")
+        res = state["metrics"]
+        lines.append(f"<b>Runtime:</b> {res.runtime:.6f}s")
 
-        if "state_updates" in state["metrics"]:
-            lines.append(f"<b>State Updates:</b> {state['metrics']['state_updates']}")
-
-        if "memory" in state["metrics"]:
-            lines.append(f"<b>Memory:</b> {state['metrics']['memory']}")
+        if solver_by_label(state["algo"]).kind == MDP:
+            lines.append(f"<b>State Updates:</b> {res.work}")
+        else:
+            lines.append(f"<b>Nodes Expanded:</b> {res.work}")
 
-        if "iterations" in state["metrics"]:
-            lines.append(f"<b>Iterations:</b> {state['metrics']['iterations']}")
+        lines.append(f"<b>Memory:</b> {res.memory}")
 
-        if "policy_iterations" in state["metrics"]:
-            lines.append(f"<b>Policy Iterations:</b> {state['metrics']['policy_iterations']}")
+        if res.iterations is not None:
+            lines.append(f"<b>Iterations:</b> {res.iterations}")
 
-        if "evaluation_iterations" in state["metrics"]:
-            lines.append(f"<b>Eval Iterations:</b> {state['metrics']['evaluation_iterations']}")
+        if "evaluation_iterations" in res.extra:
+            lines.append(f"<b>Eval Iterations:</b> {res.extra['evaluation_iterations']}")
 
         stats_box.set_text("<br>".join(lines))
 